@@ -1,14 +1,23 @@
 """Thread-safe audio buffer management."""
 
 import threading
-from collections import deque
-from typing import Optional
 
 import numpy as np
 
 
 class AudioBuffer:
-    """Thread-safe circular audio buffer."""
+    """Circular audio buffer with a lock-free hot path.
+
+    Samples are stored in a preallocated float32 ring buffer so that appends
+    and reads are slice copies instead of per-sample Python operations.
+
+    The buffer is single-producer/single-consumer: the PortAudio callback
+    appends and the transcription thread reads. `append` therefore never
+    takes a lock — the producer writes the samples first and publishes the
+    monotonic `_write_pos` last (attribute assignment is atomic under the
+    GIL), while readers snapshot `_write_pos` before touching the data.
+    A lock is kept only for the rare `clear()`.
+    """
 
     def __init__(self, max_duration_seconds: float = 300.0, sample_rate: int = 16000):
         """Initialize audio buffer.
@@ -19,19 +28,43 @@ class AudioBuffer:
         """
         self.sample_rate = sample_rate
         self.max_samples = int(max_duration_seconds * sample_rate)
-        self._buffer: deque = deque(maxlen=self.max_samples)
-        self._lock = threading.Lock()
+        self._data = np.empty(self.max_samples, dtype=np.float32)
+        self._write_pos = 0  # Monotonic count of samples ever written
+        self._read_base = 0  # Value of _write_pos at the last clear()
+        self._clear_lock = threading.Lock()
 
     def append(self, audio_chunk: np.ndarray) -> None:
         """Append audio chunk to buffer.
 
+        Lock-free; safe to call from the real-time audio callback.
+
         Args:
             audio_chunk: Audio samples as numpy array
         """
-        with self._lock:
-            # Flatten if needed and convert to float32
-            samples = audio_chunk.flatten().astype(np.float32)
-            self._buffer.extend(samples)
+        # Fast path: AudioCapture already delivers contiguous float32 mono,
+        # so ravel() is a view and nothing is copied before the ring write.
+        if audio_chunk.dtype == np.float32 and audio_chunk.flags.c_contiguous:
+            samples = audio_chunk.ravel()
+        else:
+            samples = np.ascontiguousarray(audio_chunk, dtype=np.float32).ravel()
+        n = len(samples)
+        if n == 0:
+            return
+
+        # If the chunk is larger than the ring, only the tail survives
+        if n >= self.max_samples:
+            samples = samples[-self.max_samples:]
+            n = self.max_samples
+
+        write_pos = self._write_pos
+        write = write_pos % self.max_samples
+        first = min(n, self.max_samples - write)
+        np.copyto(self._data[write:write + first], samples[:first])
+        if first < n:
+            # Wrap around to the start of the ring
+            np.copyto(self._data[:n - first], samples[first:])
+        # Publish after the data is in place
+        self._write_pos = write_pos + n
 
     def get_audio(self) -> np.ndarray:
         """Get all audio from buffer.
@@ -39,8 +72,8 @@ class AudioBuffer:
         Returns:
             Audio samples as numpy array
         """
-        with self._lock:
-            return np.array(list(self._buffer), dtype=np.float32)
+        write_pos = self._write_pos
+        return self._read_last(self._size_at(write_pos), write_pos)
 
     def get_last_n_seconds(self, seconds: float) -> np.ndarray:
         """Get last N seconds of audio.
@@ -52,20 +85,63 @@ class AudioBuffer:
             Audio samples as numpy array
         """
         n_samples = int(seconds * self.sample_rate)
-        with self._lock:
-            if len(self._buffer) <= n_samples:
-                return np.array(list(self._buffer), dtype=np.float32)
-            return np.array(list(self._buffer)[-n_samples:], dtype=np.float32)
+        write_pos = self._write_pos
+        return self._read_last(min(n_samples, self._size_at(write_pos)), write_pos)
+
+    def _size_at(self, write_pos: int) -> int:
+        """Return the number of valid samples for a snapshotted write position."""
+        return min(write_pos - self._read_base, self.max_samples)
+
+    def _read_last(self, n: int, write_pos: int) -> np.ndarray:
+        """Copy out the most recent n samples ending at a snapshotted position.
+
+        Args:
+            n: Number of samples to copy
+            write_pos: Snapshot of `_write_pos` taken before reading
+
+        Returns:
+            Audio samples as a contiguous numpy array
+        """
+        if n <= 0:
+            return np.array([], dtype=np.float32)
+
+        start = (write_pos - n) % self.max_samples
+        if start + n <= self.max_samples:
+            return self._data[start:start + n].copy()
+        # Wrapped: one output allocation, two contiguous memcpys
+        out = np.empty(n, dtype=np.float32)
+        first = self.max_samples - start
+        np.copyto(out[:first], self._data[start:])
+        np.copyto(out[first:], self._data[:n - first])
+        return out
+
+    @property
+    def position(self) -> int:
+        """Monotonic count of samples ever written (for incremental reads)."""
+        return self._write_pos
+
+    def read_since(self, position: int) -> tuple:
+        """Read samples appended since a previously returned position.
+
+        Args:
+            position: Position from a prior `position`/`read_since` call
+
+        Returns:
+            Tuple of (samples, new_position); pass new_position to the
+            next call to consume the stream incrementally
+        """
+        write_pos = self._write_pos
+        n = min(write_pos - max(position, self._read_base), self.max_samples)
+        return self._read_last(n, write_pos), write_pos
 
     def clear(self) -> None:
         """Clear the buffer."""
-        with self._lock:
-            self._buffer.clear()
+        with self._clear_lock:
+            self._read_base = self._write_pos
 
     def __len__(self) -> int:
         """Return number of samples in buffer."""
-        with self._lock:
-            return len(self._buffer)
+        return self._size_at(self._write_pos)
 
     @property
     def duration_seconds(self) -> float:
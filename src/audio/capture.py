@@ -1,5 +1,6 @@
 """Audio capture from microphone."""
 
+import functools
 import threading
 from typing import Callable, Optional
 
@@ -9,6 +10,21 @@ import sounddevice as sd
 from .buffer import AudioBuffer
 
 
+@functools.lru_cache(maxsize=1)
+def _cached_query_devices():
+    """Query PortAudio devices once and cache the result.
+
+    Enumerating the CoreAudio host API takes tens of ms, so avoid
+    repeating it for every AudioCapture instance.
+    """
+    return sd.query_devices()
+
+
+def refresh_devices() -> None:
+    """Clear the cached device list (e.g. after plugging in a microphone)."""
+    _cached_query_devices.cache_clear()
+
+
 class AudioCapture:
     """Captures audio from the microphone."""
 
@@ -35,6 +51,7 @@ class AudioCapture:
         self._buffer = AudioBuffer(sample_rate=sample_rate)
         self._stream: Optional[sd.InputStream] = None
         self._is_recording = False
+        self._status_flags = sd.CallbackFlags()
         self._lock = threading.Lock()
 
     def _resolve_device(self, device: Optional[str]) -> Optional[int]:
@@ -49,7 +66,7 @@ class AudioCapture:
         if device is None or device == "default":
             return None
 
-        devices = sd.query_devices()
+        devices = _cached_query_devices()
         for i, d in enumerate(devices):
             if device.lower() in d["name"].lower() and d["max_input_channels"] > 0:
                 return i
@@ -72,17 +89,17 @@ class AudioCapture:
             status: Stream status
         """
         if status:
-            print(f"Audio callback status: {status}")
+            # Accumulate flags; printing could block the real-time thread
+            self._status_flags |= status
 
-        # Copy data to avoid issues with buffer reuse
-        audio_chunk = indata.copy()
+        # Append copies straight into the preallocated ring buffer,
+        # so no intermediate copy of indata is needed
+        self._buffer.append(indata)
 
-        # Add to buffer
-        self._buffer.append(audio_chunk)
-
-        # Call user callback if provided
+        # Call user callback if provided (gets its own copy since
+        # PortAudio reuses indata after the callback returns)
         if self.chunk_callback:
-            self.chunk_callback(audio_chunk)
+            self.chunk_callback(indata.copy())
 
     def start(self) -> None:
         """Start recording audio."""
@@ -91,6 +108,7 @@ class AudioCapture:
                 return
 
             self._buffer.clear()
+            self._status_flags = sd.CallbackFlags()
             self._stream = sd.InputStream(
                 device=self.device,
                 samplerate=self.sample_rate,
@@ -112,6 +130,11 @@ class AudioCapture:
             if not self._is_recording:
                 return np.array([], dtype=np.float32)
 
+            # Report any status flags accumulated by the callback
+            if self._status_flags:
+                print(f"Audio callback status: {self._status_flags}")
+                self._status_flags = sd.CallbackFlags()
+
             if self._stream:
                 self._stream.stop()
                 self._stream.close()
@@ -120,6 +143,11 @@ class AudioCapture:
             self._is_recording = False
             return self._buffer.get_audio()
 
+    @property
+    def buffer(self) -> AudioBuffer:
+        """The underlying ring buffer (for incremental streaming reads)."""
+        return self._buffer
+
     @property
     def is_recording(self) -> bool:
         """Check if currently recording."""
@@ -137,7 +165,7 @@ class AudioCapture:
         Returns:
             List of device info dictionaries
         """
-        devices = sd.query_devices()
+        devices = _cached_query_devices()
         input_devices = []
         for i, d in enumerate(devices):
             if d["max_input_channels"] > 0:
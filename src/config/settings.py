@@ -1,11 +1,18 @@
 """Configuration management for the dictation app."""
 
+import json
 import os
 from pathlib import Path
 from typing import Any, Optional
 
 import yaml
 
+try:
+    # libyaml-backed loader: several times faster than the pure-Python one
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 
 class Settings:
     """Manages application settings from YAML config file."""
@@ -28,6 +35,7 @@ class Settings:
             "silence_threshold_ms": 500,
             "play_sounds": True,
             "show_floating_indicator": True,
+            "streaming_transcription": True,
         },
         "generation": {
             "enabled": True,
@@ -72,20 +80,45 @@ class Settings:
 
     def _load_config(self) -> None:
         """Load configuration from file or use defaults."""
-        self._config = self.DEFAULT_CONFIG.copy()
+        # Deep copy via the precomputed JSON template: the old shallow
+        # .copy() shared the nested dicts, so set() mutated the defaults
+        self._config = json.loads(_DEFAULT_CONFIG_JSON)
 
         if self._config_path and self._config_path.exists():
             with open(self._config_path, "r") as f:
-                file_config = yaml.safe_load(f) or {}
+                file_config = yaml.load(f, Loader=_YamlLoader) or {}
             self._merge_config(self._config, file_config)
 
+        self._rebuild_flat()
+
+    def _rebuild_flat(self) -> None:
+        """Rebuild the flat dotted-key lookup map from the nested config."""
+        self._flat: dict = {}
+        self._flatten(self._config, "")
+
+    def _flatten(self, config: dict, prefix: str) -> None:
+        """Recursively flatten nested config into `self._flat`.
+
+        Args:
+            config: Nested config dict
+            prefix: Dotted prefix for keys at this level
+        """
+        for key, value in config.items():
+            dotted = f"{prefix}{key}"
+            self._flat[dotted] = value
+            if isinstance(value, dict):
+                self._flatten(value, f"{dotted}.")
+
     def _merge_config(self, base: dict, override: dict) -> None:
-        """Recursively merge override into base config."""
-        for key, value in override.items():
-            if key in base and isinstance(base[key], dict) and isinstance(value, dict):
-                self._merge_config(base[key], value)
-            else:
-                base[key] = value
+        """Merge override into base config (iterative, no recursion)."""
+        stack = [(base, override)]
+        while stack:
+            dst, src = stack.pop()
+            for key, value in src.items():
+                if key in dst and isinstance(dst[key], dict) and isinstance(value, dict):
+                    stack.append((dst[key], value))
+                else:
+                    dst[key] = value
 
     def get(self, key: str, default: Any = None) -> Any:
         """Get a config value using dot notation.
@@ -97,16 +130,7 @@ class Settings:
         Returns:
             Config value or default
         """
-        keys = key.split(".")
-        value = self._config
-
-        for k in keys:
-            if isinstance(value, dict) and k in value:
-                value = value[k]
-            else:
-                return default
-
-        return value
+        return self._flat.get(key, default)
 
     def set(self, key: str, value: Any) -> None:
         """Set a config value using dot notation.
@@ -124,6 +148,7 @@ class Settings:
             config = config[k]
 
         config[keys[-1]] = value
+        self._rebuild_flat()
 
     def save(self, path: Optional[str] = None) -> None:
         """Save current config to file.
@@ -177,6 +202,10 @@ class Settings:
     def stop_key(self) -> str:
         return self.get("behavior.stop_key", "enter")
 
+    @property
+    def streaming_transcription(self) -> bool:
+        return self.get("behavior.streaming_transcription", True)
+
     @property
     def silence_threshold_ms(self) -> int:
         return self.get("behavior.silence_threshold_ms", 500)
@@ -222,3 +251,8 @@ class Settings:
     @property
     def insertion_method(self) -> str:
         return self.get("behavior.insertion_method", "auto")
+
+
+# Precomputed at import: json round-trip is a fast deep copy for the
+# plain dict/str/bool default config
+_DEFAULT_CONFIG_JSON = json.dumps(Settings.DEFAULT_CONFIG)
@@ -1,7 +1,9 @@
 """Message drafting using LLM to transform spoken intent into professional messages."""
 
 import os
-from typing import Optional
+from typing import Callable, Optional
+
+LANG_NAMES = {"en": "English", "es": "Spanish"}
 
 
 class MessageDrafter:
@@ -46,6 +48,10 @@ Examples:
         self.model = model or self._default_model()
         self.ollama_host = ollama_host or "http://localhost:11434"
         self._client = None
+        self._ollama_ready: Optional[bool] = None
+        # Prebuilt message/options reused across calls
+        self._system_message = {"role": "system", "content": self.SYSTEM_PROMPT}
+        self._ollama_options = {"temperature": 0.7, "num_ctx": 2048}
 
     def _get_api_key(self) -> Optional[str]:
         """Get API key from environment variable."""
@@ -109,13 +115,19 @@ Examples:
         intent: str,
         context: Optional[str] = None,
         language: Optional[str] = None,
+        on_token: Optional[Callable[[str], None]] = None,
     ) -> str:
         """Generate a professional message from spoken intent.
 
+        Responses are streamed from the provider so the first tokens are
+        available as soon as they are generated; the lazily created client
+        is reused across calls, keeping the HTTP connection alive.
+
         Args:
             intent: The transcribed spoken intent/instructions
             context: Optional context (e.g., previous email content)
             language: Language code for the output (e.g., 'en', 'es')
+            on_token: Optional callback invoked with each streamed text delta
 
         Returns:
             The drafted professional message
@@ -127,49 +139,87 @@ Examples:
         if context:
             user_message = f"Context:\n{context}\n\n{user_message}"
         if language:
-            lang_names = {"en": "English", "es": "Spanish"}
-            lang_name = lang_names.get(language, language)
+            lang_name = LANG_NAMES.get(language, language)
             user_message += f"\n\nPlease write the message in {lang_name}."
 
+        parts = []
+
+        def emit(delta: str) -> None:
+            if delta:
+                parts.append(delta)
+                if on_token:
+                    on_token(delta)
+
         # Call the appropriate API
         if self.provider == "ollama":
-            response = client.chat(
+            stream = client.chat(
                 model=self.model,
                 messages=[
-                    {"role": "system", "content": self.SYSTEM_PROMPT},
+                    self._system_message,
                     {"role": "user", "content": user_message},
                 ],
-                options={
-                    "temperature": 0.7,
-                },
+                options=self._ollama_options,
+                # Keep the model (and the system prompt's KV cache) loaded
+                # between dictations so repeat calls skip the re-prefill
+                keep_alive="30m",
+                stream=True,
             )
-            return response["message"]["content"].strip()
+            for chunk in stream:
+                emit(chunk["message"]["content"])
+            return "".join(parts).strip()
 
         elif self.provider == "openai":
-            response = client.chat.completions.create(
+            stream = client.chat.completions.create(
                 model=self.model,
                 messages=[
-                    {"role": "system", "content": self.SYSTEM_PROMPT},
+                    self._system_message,
                     {"role": "user", "content": user_message},
                 ],
                 temperature=0.7,
                 max_tokens=1000,
+                stream=True,
             )
-            return response.choices[0].message.content.strip()
+            for chunk in stream:
+                if chunk.choices:
+                    emit(chunk.choices[0].delta.content or "")
+            return "".join(parts).strip()
 
         elif self.provider == "anthropic":
-            response = client.messages.create(
+            with client.messages.stream(
                 model=self.model,
                 max_tokens=1000,
                 system=self.SYSTEM_PROMPT,
                 messages=[
                     {"role": "user", "content": user_message},
                 ],
-            )
-            return response.content[0].text.strip()
+            ) as stream:
+                for delta in stream.text_stream:
+                    emit(delta)
+            return "".join(parts).strip()
 
         raise ValueError(f"Unsupported provider: {self.provider}")
 
+    def warm_up(self) -> None:
+        """Load the Ollama model into memory ahead of the first draft.
+
+        Generates a single token so the model (and the system prompt's KV
+        cache) is resident before the user dictates. No-op for hosted
+        providers, which have no per-process load cost.
+        """
+        if self.provider != "ollama":
+            return
+
+        try:
+            client = self._get_client()
+            client.chat(
+                model=self.model,
+                messages=[self._system_message],
+                options={"num_predict": 1},
+                keep_alive="30m",
+            )
+        except Exception as e:
+            print(f"LLM warmup failed (non-fatal): {e}")
+
     def is_configured(self) -> bool:
         """Check if the drafter is properly configured.
 
@@ -184,49 +234,56 @@ Examples:
     def check_ollama_available(self) -> bool:
         """Check if Ollama server is running and model is available.
 
+        The result is cached for the lifetime of the drafter so the UI
+        path does not repeat the HTTP round-trip on every call.
+
         Returns:
             True if Ollama is ready
         """
         if self.provider != "ollama":
             return True
 
+        if self._ollama_ready is not None:
+            return self._ollama_ready
+
         try:
-            import ollama
-            client = ollama.Client(host=self.ollama_host)
+            # Reuse the lazily created client and its connection
+            client = self._get_client()
             # Try to list models to check connection
             response = client.list()
 
             # Handle different response formats from ollama library
-            model_names = []
             if isinstance(response, dict):
                 model_list = response.get("models", [])
             else:
                 model_list = getattr(response, "models", [])
 
-            for m in model_list:
-                # Try different attribute names used by ollama library
-                name = None
-                if isinstance(m, dict):
-                    name = m.get("name") or m.get("model", "")
-                else:
-                    # It's an object - try .name first, then .model
-                    name = getattr(m, "name", None) or getattr(m, "model", None) or ""
-
-                if name:
-                    # Remove :latest or other tags for comparison
-                    base_name = name.split(":")[0]
-                    model_names.append(base_name)
+            # Collect base names (without tags like :8b or :latest);
+            # the library returns dicts or objects depending on version
+            model_names = {
+                name.split(":")[0]
+                for m in model_list
+                for name in (
+                    m.get("name") or m.get("model", "")
+                    if isinstance(m, dict)
+                    else getattr(m, "name", None) or getattr(m, "model", None) or "",
+                )
+                if name
+            }
 
             # Compare base names (without tags like :8b or :latest)
             target_base = self.model.split(":")[0]
             if target_base not in model_names:
                 print(f"Warning: Model '{self.model}' not found in Ollama.")
-                print(f"Available models: {', '.join(model_names) or 'none'}")
+                print(f"Available models: {', '.join(sorted(model_names)) or 'none'}")
                 print(f"Run: ollama pull {self.model}")
+                self._ollama_ready = False
                 return False
+            self._ollama_ready = True
             return True
         except Exception as e:
             print(f"Warning: Cannot connect to Ollama at {self.ollama_host}")
             print(f"Error: {e}")
             print("Make sure Ollama is running: ollama serve")
+            self._ollama_ready = False
             return False
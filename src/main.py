@@ -6,10 +6,12 @@ A macOS dictation application using OpenAI Whisper for local transcription.
 Supports Spanish and English with automatic language detection.
 """
 
+import logging
 import signal
 import sys
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 
@@ -19,28 +21,34 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from src.audio.capture import AudioCapture
 from src.audio.vad import VoiceActivityDetector
 from src.config.settings import Settings
-from src.generation.drafting import MessageDrafter
 from src.system.clipboard_history import get_history
-from src.system.hotkey import HotkeyListener
 from src.system.insertion import TextInserter
-from src.system.tray import MenuBarApp
-from src.transcription.engine import WhisperEngine
+from src.transcription.engine import TranscriptionResult, WhisperEngine
 from src.transcription.processor import TextProcessor
-from src.ui.context_input import create_context_input
-from src.ui.control_panel import create_control_panel
-from src.ui.indicator import create_indicator
+
+logger = logging.getLogger("dictation")
+
+# HotkeyListener, MenuBarApp, the UI factories and MessageDrafter are
+# imported lazily inside the _init_* methods: they pull in pynput, rumps,
+# tkinter and LLM SDKs, which would add seconds to cold start (and
+# --list-devices needs none of them).
 
 
 class DictationApp:
     """Main dictation application controller."""
 
+    # Streaming transcription: segment size targets and boundary detection
+    STREAM_SEGMENT_SECONDS = 4.0
+    STREAM_MAX_SEGMENT_SECONDS = 8.0
+    STREAM_BOUNDARY_SILENCE_SECONDS = 0.3
+
     def __init__(self, config_path: Optional[str] = None):
         """Initialize the dictation app.
 
         Args:
             config_path: Path to configuration file
         """
-        print("Initializing Dictation App...")
+        logger.info("Initializing Dictation App...")
 
         # Load configuration
         self.settings = Settings(config_path)
@@ -56,6 +64,9 @@ class DictationApp:
         self._lock = threading.Lock()
         self._running = True
 
+        # Worker pool so drafting can overlap UI updates
+        self._pipeline = ThreadPoolExecutor(max_workers=2)
+
     def _init_audio(self) -> None:
         """Initialize audio components."""
         self.audio_capture = AudioCapture(
@@ -65,10 +76,17 @@ class DictationApp:
             else None,
         )
         self.vad = VoiceActivityDetector(sample_rate=self.settings.sample_rate)
+        # Precomputed for duration prints (also fixes hardcoded 16000)
+        self._inv_sr = 1.0 / self.settings.sample_rate
 
     def _init_transcription(self) -> None:
         """Initialize transcription components."""
-        self.whisper = WhisperEngine(
+        # Construct the engine on a background thread so model loading
+        # overlaps with hotkey registration and UI setup; the whisper
+        # property blocks on the future only when first needed
+        self._whisper: Optional[WhisperEngine] = None
+        self._whisper_future = ThreadPoolExecutor(max_workers=1).submit(
+            WhisperEngine,
             model_name=self.settings.model_name,
             device=self.settings.device,
             compute_type=self.settings.compute_type,
@@ -79,10 +97,13 @@ class DictationApp:
             enable_commands=self.settings.voice_commands_enabled,
         )
 
-        # Initialize message drafter for generative mode
+        # Initialize message drafter for generative mode (the LLM SDK
+        # import is deferred until drafting is actually enabled)
         self.generation_enabled = self.settings.generation_enabled
         self.drafter = None
         if self.generation_enabled:
+            from src.generation.drafting import MessageDrafter
+
             self.drafter = MessageDrafter(
                 api_key=self.settings.generation_api_key,
                 provider=self.settings.generation_provider,
@@ -90,20 +111,28 @@ class DictationApp:
                 ollama_host=self.settings.ollama_host,
             )
             if not self.drafter.is_configured():
-                print("Warning: Generation enabled but not properly configured.")
-                print("Falling back to transcription mode.")
+                logger.warning("Generation enabled but not properly configured.")
+                logger.warning("Falling back to transcription mode.")
                 self.generation_enabled = False
             elif self.settings.generation_provider == "ollama":
                 # Check if Ollama is available
                 if not self.drafter.check_ollama_available():
-                    print("Falling back to transcription mode.")
+                    logger.warning("Falling back to transcription mode.")
                     self.generation_enabled = False
 
         # Optional context for message generation
         self._context: Optional[str] = None
 
+        # Streaming transcription state (segments transcribed mid-recording)
+        self._stream_thread: Optional[threading.Thread] = None
+        self._stream_results: list = []
+        self._stream_pos = 0
+        self._stream_start_pos = 0
+
     def _init_system(self) -> None:
         """Initialize system integration components."""
+        from src.system.hotkey import HotkeyListener
+
         self.inserter = TextInserter(method=self.settings.insertion_method)
         self.hotkey = HotkeyListener(
             hotkey=self.settings.hotkey,
@@ -115,6 +144,11 @@ class DictationApp:
 
     def _init_ui(self) -> None:
         """Initialize UI components."""
+        from src.system.tray import MenuBarApp
+        from src.ui.context_input import create_context_input
+        from src.ui.control_panel import create_control_panel
+        from src.ui.indicator import create_indicator
+
         self.indicator = create_indicator(enabled=self.settings.show_indicator)
 
         # Context input window (for generative mode)
@@ -149,6 +183,28 @@ class DictationApp:
             generation_available=self._generation_available,
         )
 
+        # State updates fan out to these; filtered once so the hot
+        # dictation path doesn't re-test "if self.control_panel" per call
+        self._ui_sinks = [
+            s for s in (self.menu_bar, self.control_panel) if s is not None
+        ]
+
+        # Last context status broadcast to the UI (avoids icon redraws
+        # when the user re-saves identical context)
+        self._last_ctx_status = False
+
+    def _broadcast(self, method: str, *args) -> None:
+        """Invoke a method on every UI sink (menu bar, control panel)."""
+        for sink in self._ui_sinks:
+            getattr(sink, method)(*args)
+
+    @property
+    def whisper(self) -> WhisperEngine:
+        """The Whisper engine (waits for the background load on first use)."""
+        if self._whisper is None:
+            self._whisper = self._whisper_future.result()
+        return self._whisper
+
     def _on_hotkey_press(self) -> None:
         """Handle hotkey press - start recording."""
         with self._lock:
@@ -177,13 +233,23 @@ class DictationApp:
 
         # Update UI
         self.indicator.show("listening")
-        self.menu_bar.set_state("recording")
-        if self.control_panel:
-            self.control_panel.set_state("recording")
+        self._broadcast("set_state", "recording")
 
         # Start capture
         self.audio_capture.start()
-        print("Recording started...")
+
+        # Transcribe segments while the user is still speaking, so only
+        # the tail remains when the hotkey is released
+        self._stream_results = []
+        self._stream_start_pos = self.audio_capture.buffer.position
+        self._stream_pos = self._stream_start_pos
+        if self.settings.streaming_transcription:
+            self._stream_thread = threading.Thread(
+                target=self._stream_worker, daemon=True
+            )
+            self._stream_thread.start()
+
+        logger.info("Recording started...")
 
     def _stop_and_transcribe(self) -> None:
         """Stop recording and transcribe audio."""
@@ -191,16 +257,128 @@ class DictationApp:
         audio = self.audio_capture.stop()
         self._is_recording = False
 
+        # Bail out before any UI transitions or thread spawn on an
+        # obvious misfire (accidental tap shorter than 0.5s)
+        if len(audio) < 8000:
+            logger.info("Recording too short, skipping...")
+            self.indicator.hide(delay=0.2)
+            self._broadcast("set_state", "idle")
+            return
+
         # Update UI
         self.indicator.update("processing")
-        self.menu_bar.set_state("processing")
-        if self.control_panel:
-            self.control_panel.set_state("processing")
-        print(f"Recording stopped. Duration: {len(audio) / 16000:.1f}s")
+        self._broadcast("set_state", "processing")
+        logger.info("Recording stopped. Duration: %.1fs", len(audio) * self._inv_sr)
 
         # Process in background to not block
         threading.Thread(target=self._process_audio, args=(audio,), daemon=True).start()
 
+    def _stream_worker(self) -> None:
+        """Transcribe fixed-size segments while recording is still running.
+
+        Segments are cut at silence boundaries (per VAD) where possible so
+        words are not split; a hard cap keeps segments bounded when the
+        speaker never pauses.
+        """
+        sample_rate = self.settings.sample_rate
+        segment_samples = int(self.STREAM_SEGMENT_SECONDS * sample_rate)
+        max_samples = int(self.STREAM_MAX_SEGMENT_SECONDS * sample_rate)
+        boundary_samples = int(self.STREAM_BOUNDARY_SILENCE_SECONDS * sample_rate)
+
+        while self._is_recording:
+            buffered, _ = self.audio_capture.buffer.read_since(self._stream_pos)
+            n = len(buffered)
+            if n < segment_samples:
+                time.sleep(0.1)
+                continue
+
+            if n < max_samples:
+                # Wait for a pause before cutting the segment
+                try:
+                    tail_is_speech, _ = self.vad.is_speech(buffered[-boundary_samples:])
+                except Exception:
+                    tail_is_speech = False
+                if tail_is_speech:
+                    time.sleep(0.1)
+                    continue
+
+            self._stream_pos += n
+            try:
+                result = self.whisper.transcribe(buffered)
+                if result.text:
+                    self._stream_results.append(result)
+            except Exception as e:
+                logger.error("Streaming transcription error: %s", e)
+
+    def _transcribe_recording(self, audio) -> TranscriptionResult:
+        """Transcribe a finished recording, reusing streamed segments.
+
+        Args:
+            audio: Full recording as numpy array
+
+        Returns:
+            TranscriptionResult covering the whole recording
+        """
+        if self._stream_thread is not None:
+            self._stream_thread.join(timeout=30.0)
+            self._stream_thread = None
+
+        results = list(self._stream_results)
+        if not results:
+            return self.whisper.transcribe(audio)
+
+        # Only the tail after the last streamed segment is left to do
+        consumed = self._stream_pos - self._stream_start_pos
+        tail = audio[consumed:]
+        if len(tail) >= int(0.3 * self.settings.sample_rate):
+            tail_result = self.whisper.transcribe(tail)
+            if tail_result.text:
+                results.append(tail_result)
+
+        first = results[0]
+        return TranscriptionResult(
+            text=" ".join(r.text for r in results),
+            language=first.language,
+            language_probability=first.language_probability,
+            segments=[s for r in results for s in r.segments],
+        )
+
+    def _draft_or_process(self, text: str, language: str) -> str:
+        """Turn a raw transcription into the final output text.
+
+        Args:
+            text: Raw transcribed text
+            language: Detected language code
+
+        Returns:
+            Drafted message (generative mode) or cleaned-up transcription
+        """
+        if self.generation_enabled and self.drafter:
+            # Generative mode: transform intent into professional message
+            logger.info("Generating message from intent...")
+            preview = []
+
+            def on_token(delta: str) -> None:
+                # Show streamed text on the indicator as it arrives, so the
+                # user sees progress from the first token
+                preview.append(delta)
+                if len(preview) == 1 or len(preview) % 8 == 0:
+                    tail = "".join(preview)[-40:].replace("\n", " ")
+                    self.indicator.set_text(f"✨ {tail}")
+
+            final_text = self.drafter.draft(
+                intent=text,
+                context=self._context,
+                language=language,
+                on_token=on_token,
+            )
+            logger.info("Generated message: %s", final_text)
+        else:
+            # Transcription mode: process text (voice commands, cleanup)
+            final_text = self.processor.process(text, language)
+            logger.info("Processed text: %s", final_text)
+        return final_text
+
     def _process_audio(self, audio) -> None:
         """Process recorded audio (runs in background thread).
 
@@ -210,11 +388,9 @@ class DictationApp:
         try:
             # Check minimum duration
             if len(audio) < 8000:  # Less than 0.5 seconds
-                print("Recording too short, skipping...")
+                logger.info("Recording too short, skipping...")
                 self.indicator.hide(delay=0.5)
-                self.menu_bar.set_state("idle")
-                if self.control_panel:
-                    self.control_panel.set_state("idle")
+                self._broadcast("set_state", "idle")
                 return
 
             # Trim silence with VAD (optional, Whisper has built-in VAD)
@@ -225,47 +401,36 @@ class DictationApp:
             #     self.menu_bar.set_state("idle")
             #     return
 
-            # Transcribe
-            print("Transcribing...")
-            result = self.whisper.transcribe(audio)
+            # Transcribe (reusing any segments streamed during recording)
+            logger.info("Transcribing...")
+            result = self._transcribe_recording(audio)
 
             if not result.text:
-                print("No text transcribed")
+                logger.info("No text transcribed")
                 self.indicator.hide(delay=0.5)
-                self.menu_bar.set_state("idle")
-                if self.control_panel:
-                    self.control_panel.set_state("idle")
+                self._broadcast("set_state", "idle")
                 return
 
-            print(f"Detected language: {result.language}")
-            print(f"Raw transcription: {result.text}")
+            logger.info("Detected language: %s", result.language)
+            logger.info("Raw transcription: %s", result.text)
 
-            # Generate or process text based on mode
+            # Kick off drafting/processing immediately; UI updates below
+            # run while the LLM generates
+            future = self._pipeline.submit(
+                self._draft_or_process, result.text, result.language
+            )
             if self.generation_enabled and self.drafter:
-                # Generative mode: transform intent into professional message
-                print("Generating message from intent...")
                 self.indicator.set_text("✨ Drafting...")
-                final_text = self.drafter.draft(
-                    intent=result.text,
-                    context=self._context,
-                    language=result.language,
-                )
-                print(f"Generated message: {final_text}")
-            else:
-                # Transcription mode: process text (voice commands, cleanup)
-                final_text = self.processor.process(result.text, result.language)
-                print(f"Processed text: {final_text}")
+            final_text = future.result()
 
             # Update UI to done state
             self.indicator.update("done")
-            self.menu_bar.set_state("done", result.language)
-            if self.control_panel:
-                self.control_panel.set_state("done", result.language)
+            self._broadcast("set_state", "done", result.language)
 
             # Insert text
             success = self.inserter.insert(final_text)
             if success:
-                print("Text inserted successfully")
+                logger.info("Text inserted successfully")
                 # Save to clipboard history
                 mode = "drafting" if self.generation_enabled else "transcription"
                 get_history().add(
@@ -274,24 +439,22 @@ class DictationApp:
                     mode=mode,
                 )
             else:
-                print("Failed to insert text")
+                logger.warning("Failed to insert text")
                 self.indicator.set_text("❌ Insert failed")
 
             # Hide indicator after a moment
             self.indicator.hide(delay=1.0)
 
         except Exception as e:
-            print(f"Error processing audio: {e}")
-            self.indicator.update("error")
-            self.indicator.set_text(f"❌ {str(e)[:20]}")
-            self.indicator.hide(delay=2.0)
-            self.menu_bar.set_state("error")
-            if self.control_panel:
-                self.control_panel.set_state("error")
+            logger.error("Error processing audio: %s", e)
+            self.indicator.transition(
+                "error", auto_hide_after=2.0, text=f"❌ {str(e)[:20]}"
+            )
+            self._broadcast("set_state", "error")
 
     def _on_quit(self) -> None:
         """Handle quit request."""
-        print("Shutting down...")
+        logger.info("Shutting down...")
         self._running = False
         self.hotkey.stop()
 
@@ -308,16 +471,18 @@ class DictationApp:
         """Handle context being saved from the UI."""
         self.set_context(context)
         has_context = bool(context and context.strip())
-        self.menu_bar.update_context_status(has_context)
-        if self.control_panel:
-            self.control_panel.update_context_status(has_context)
+        if has_context == self._last_ctx_status:
+            return
+        self._last_ctx_status = has_context
+        self._broadcast("update_context_status", has_context)
 
     def _on_context_clear(self) -> None:
         """Handle context being cleared from the UI."""
         self.clear_context()
-        self.menu_bar.update_context_status(False)
-        if self.control_panel:
-            self.control_panel.update_context_status(False)
+        if not self._last_ctx_status:
+            return
+        self._last_ctx_status = False
+        self._broadcast("update_context_status", False)
 
     def _on_mode_toggle(self, drafting_enabled: bool) -> None:
         """Handle mode toggle from menu bar or control panel.
@@ -327,7 +492,7 @@ class DictationApp:
         """
         self.generation_enabled = drafting_enabled
         mode_name = "Drafting" if drafting_enabled else "Transcription"
-        print(f"Mode changed to: {mode_name}")
+        logger.info("Mode changed to: %s", mode_name)
 
     def _on_language_change(self, language: str) -> None:
         """Handle language change from control panel.
@@ -338,7 +503,7 @@ class DictationApp:
         # Update whisper engine language setting
         lang = None if language == "auto" else language
         self.whisper.language = lang
-        print(f"Language changed to: {language}")
+        logger.info("Language changed to: %s", language)
 
     def set_context(self, context: Optional[str]) -> None:
         """Set optional context for message generation.
@@ -348,14 +513,14 @@ class DictationApp:
         """
         self._context = context.strip() if context else None
         if self._context:
-            print(f"Context set ({len(self._context)} chars)")
+            logger.info("Context set (%d chars)", len(self._context))
         else:
-            print("Context cleared")
+            logger.info("Context cleared")
 
     def clear_context(self) -> None:
         """Clear the optional context."""
         self._context = None
-        print("Context cleared")
+        logger.info("Context cleared")
 
     def has_context(self) -> bool:
         """Check if context is currently set."""
@@ -363,9 +528,25 @@ class DictationApp:
 
     def preload_model(self) -> None:
         """Preload the Whisper model for faster first transcription."""
-        print("Preloading Whisper model (this may take a moment)...")
+        logger.info("Preloading Whisper model (this may take a moment)...")
         self.whisper.preload()
-        print("Model preloaded and ready!")
+
+        # Run one dummy transcription so kernels, caches and tokenizer
+        # tables are materialized before the first hotkey press
+        try:
+            import numpy as np
+
+            self.whisper.transcribe(
+                np.zeros(16000, dtype=np.float32), vad_filter=False
+            )
+        except Exception as e:
+            logger.warning("Warmup transcription failed (non-fatal): %s", e)
+
+        # Warm the drafting LLM too so the first draft skips model load
+        if self.generation_enabled and self.drafter:
+            self.drafter.warm_up()
+
+        logger.info("Model preloaded and ready!")
 
     def run(self) -> None:
         """Run the dictation app."""
@@ -463,7 +644,7 @@ class DictationApp:
 
         # Stop recording
         audio = self.audio_capture.stop()
-        print(f"\nRecording stopped. Duration: {len(audio) / 16000:.1f}s")
+        print(f"\nRecording stopped. Duration: {len(audio) * self._inv_sr:.1f}s")
 
         # Update UI
         self.indicator.update("processing")
@@ -487,9 +668,12 @@ class DictationApp:
                 self.indicator.hide()
                 sys.exit(1)
 
-            # Transcribe
+            # Transcribe (long recordings batched across VAD segments)
             print("Transcribing...")
-            result = self.whisper.transcribe(audio)
+            if len(audio) > 30 * self.settings.sample_rate:
+                result = self.whisper.transcribe_batched(audio)
+            else:
+                result = self.whisper.transcribe(audio)
 
             if not result.text:
                 print("No text transcribed")
@@ -501,15 +685,8 @@ class DictationApp:
 
             # Generate or process text based on mode
             if self.generation_enabled and self.drafter:
-                print("\nGenerating message from intent...")
                 self.indicator.set_text("✨ Drafting...")
-                final_text = self.drafter.draft(
-                    intent=result.text,
-                    context=self._context,
-                    language=result.language,
-                )
-            else:
-                final_text = self.processor.process(result.text, result.language)
+            final_text = self._draft_or_process(result.text, result.language)
 
             print("\n" + "=" * 50)
             print("RESULT (copied to clipboard):")
@@ -551,6 +728,9 @@ def main():
     """Main entry point."""
     import argparse
 
+    # Plain message format keeps CLI output identical to the old print()s
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
     parser = argparse.ArgumentParser(description="Local dictation app with Whisper")
     parser.add_argument(
         "--config",
@@ -1,11 +1,24 @@
 """Clipboard history management for the dictation app."""
 
+import functools
 import json
 import os
+import queue
+import threading
+import time
 from datetime import datetime
+from collections import deque
+from itertools import islice
 from pathlib import Path
-from typing import List, Optional
-from dataclasses import dataclass, asdict
+from typing import Deque, List, Optional
+from dataclasses import dataclass
+
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
 
 @dataclass
@@ -16,8 +29,29 @@ class HistoryEntry:
     language: Optional[str] = None
     mode: str = "transcription"  # "transcription" or "drafting"
 
+    def __post_init__(self):
+        # Cache the lowercased text for case-insensitive search, so
+        # interactive search doesn't re-lowercase every entry per query
+        self.text_lower = self.text.lower()
+        # Cache the rendered timestamp; the history UI re-renders rows
+        # on every refresh and re-parsing the ISO string per row adds up
+        try:
+            self.display_time = datetime.fromisoformat(
+                self.timestamp
+            ).strftime("%m/%d %H:%M")
+        except ValueError:
+            self.display_time = "Unknown"
+        # Cache the serialized form once; entries are immutable after
+        # creation and asdict() deep-copies on every call
+        self._dict = {
+            "text": self.text,
+            "timestamp": self.timestamp,
+            "language": self.language,
+            "mode": self.mode,
+        }
+
     def to_dict(self) -> dict:
-        return asdict(self)
+        return self._dict
 
     @classmethod
     def from_dict(cls, data: dict) -> "HistoryEntry":
@@ -34,6 +68,10 @@ class ClipboardHistory:
 
     DEFAULT_MAX_ENTRIES = 50
 
+    # Debounce window for the background writer; rapid adds coalesce
+    # into a single file write
+    SAVE_DEBOUNCE_SECONDS = 0.2
+
     def __init__(
         self,
         history_path: Optional[str] = None,
@@ -55,35 +93,70 @@ class ClipboardHistory:
             config_dir.mkdir(parents=True, exist_ok=True)
             self._history_path = config_dir / "clipboard_history.json"
 
-        self._entries: List[HistoryEntry] = []
+        # deque(maxlen) gives O(1) appendleft with automatic eviction of
+        # the oldest entry, vs list.insert(0, ...) which is O(N)
+        self._entries: Deque[HistoryEntry] = deque(maxlen=max_entries)
         self._load()
 
+        # Saves happen on a background thread so add() never blocks the
+        # dictation finalization path on disk I/O
+        self._save_queue: queue.Queue = queue.Queue()
+        self._writer = threading.Thread(
+            target=self._writer_loop, daemon=True, name="history-writer"
+        )
+        self._writer.start()
+
     def _load(self) -> None:
         """Load history from file."""
         if not self._history_path.exists():
-            self._entries = []
             return
 
         try:
-            with open(self._history_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                self._entries = [
-                    HistoryEntry.from_dict(entry)
-                    for entry in data.get("entries", [])
-                ]
-        except (json.JSONDecodeError, IOError) as e:
+            raw = self._history_path.read_bytes()
+            data = orjson.loads(raw) if HAS_ORJSON else json.loads(raw)
+            # _save always writes the full schema, so rows construct
+            # directly without from_dict's per-field .get() lookups
+            self._entries = deque(
+                (HistoryEntry(**row) for row in data.get("entries", [])),
+                maxlen=self.max_entries,
+            )
+        except (ValueError, TypeError, IOError) as e:
             print(f"Error loading clipboard history: {e}")
-            self._entries = []
+            self._entries.clear()
+
+    def _writer_loop(self) -> None:
+        """Background writer: debounce save requests, then write once."""
+        while True:
+            self._save_queue.get()
+            time.sleep(self.SAVE_DEBOUNCE_SECONDS)
+            # Drain any requests that arrived during the debounce window
+            while True:
+                try:
+                    self._save_queue.get_nowait()
+                except queue.Empty:
+                    break
+            self._save()
+
+    def _request_save(self) -> None:
+        """Queue a save for the background writer (returns immediately)."""
+        self._save_queue.put(None)
 
     def _save(self) -> None:
-        """Save history to file."""
+        """Save history to file (atomically, via a temp file rename)."""
         try:
             data = {
                 "version": 1,
-                "entries": [entry.to_dict() for entry in self._entries],
+                "entries": [entry.to_dict() for entry in list(self._entries)],
             }
-            with open(self._history_path, "w", encoding="utf-8") as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            if HAS_ORJSON:
+                buf = orjson.dumps(data, option=orjson.OPT_APPEND_NEWLINE)
+            else:
+                buf = json.dumps(data, ensure_ascii=False).encode("utf-8")
+
+            # Write-then-rename so a crash can never leave a truncated file
+            tmp_path = self._history_path.with_suffix(".tmp")
+            tmp_path.write_bytes(buf)
+            os.replace(tmp_path, self._history_path)
         except IOError as e:
             print(f"Error saving clipboard history: {e}")
 
@@ -105,23 +178,20 @@ class ClipboardHistory:
 
         entry = HistoryEntry(
             text=text.strip(),
-            timestamp=datetime.now().isoformat(),
+            # strftime avoids the datetime allocation of now().isoformat()
+            timestamp=time.strftime("%Y-%m-%dT%H:%M:%S"),
             language=language,
             mode=mode,
         )
 
-        # Add to beginning (most recent first)
-        self._entries.insert(0, entry)
+        # Add to beginning (most recent first); maxlen evicts the oldest
+        self._entries.appendleft(entry)
 
-        # Trim to max entries
-        if len(self._entries) > self.max_entries:
-            self._entries = self._entries[:self.max_entries]
-
-        self._save()
+        self._request_save()
 
     def get_all(self) -> List[HistoryEntry]:
         """Get all history entries (most recent first)."""
-        return self._entries.copy()
+        return list(self._entries)
 
     def get_recent(self, count: int = 10) -> List[HistoryEntry]:
         """Get the most recent N entries.
@@ -129,7 +199,7 @@ class ClipboardHistory:
         Args:
             count: Number of entries to return.
         """
-        return self._entries[:count]
+        return list(islice(self._entries, count))
 
     def get_by_index(self, index: int) -> Optional[HistoryEntry]:
         """Get an entry by index (0 = most recent).
@@ -143,8 +213,8 @@ class ClipboardHistory:
 
     def clear(self) -> None:
         """Clear all history entries."""
-        self._entries = []
-        self._save()
+        self._entries.clear()
+        self._request_save()
 
     def delete(self, index: int) -> bool:
         """Delete an entry by index.
@@ -157,7 +227,7 @@ class ClipboardHistory:
         """
         if 0 <= index < len(self._entries):
             del self._entries[index]
-            self._save()
+            self._request_save()
             return True
         return False
 
@@ -173,7 +243,7 @@ class ClipboardHistory:
         query_lower = query.lower()
         return [
             entry for entry in self._entries
-            if query_lower in entry.text.lower()
+            if query_lower in entry.text_lower
         ]
 
     def __len__(self) -> int:
@@ -185,13 +255,11 @@ class ClipboardHistory:
         return iter(self._entries)
 
 
-# Global history instance (singleton pattern)
-_history_instance: Optional[ClipboardHistory] = None
-
-
+@functools.lru_cache(maxsize=1)
 def get_history() -> ClipboardHistory:
-    """Get the global clipboard history instance."""
-    global _history_instance
-    if _history_instance is None:
-        _history_instance = ClipboardHistory()
-    return _history_instance
+    """Get the global clipboard history instance.
+
+    lru_cache makes the singleton creation thread-safe (single file
+    read even if multiple UI threads race on first access).
+    """
+    return ClipboardHistory()
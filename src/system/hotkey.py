@@ -1,10 +1,48 @@
 """Global hotkey detection for macOS."""
 
+import queue
 import threading
-from typing import Callable, Optional, Set
+from types import MappingProxyType
+from typing import Callable, Dict, Mapping, Optional, Set
 
 from pynput import keyboard
 
+# Named (non-modifier) keys usable as trigger or stop key
+_NAME_TO_KEY = {
+    "space": keyboard.Key.space,
+    "tab": keyboard.Key.tab,
+    "enter": keyboard.Key.enter,
+    "esc": keyboard.Key.esc,
+    **{f"f{n}": getattr(keyboard.Key, f"f{n}") for n in range(1, 13)},
+}
+
+
+def _parse_key(name: str):
+    """Resolve a key name to a pynput key, or None if unknown."""
+    key = _NAME_TO_KEY.get(name)
+    if key is not None:
+        return key
+    if len(name) == 1:
+        return keyboard.KeyCode.from_char(name)
+    return None
+
+
+def _make_matcher(key) -> Callable:
+    """Build a comparator bound to a fixed key.
+
+    The key's type is known once parsed, so the per-event check is a
+    single closure call with the branch already decided, instead of
+    re-running isinstance on both sides for every keystroke.
+    """
+    if key is None:
+        return lambda other: False
+    if isinstance(key, keyboard.KeyCode):
+        char = key.char
+        return lambda other: (
+            isinstance(other, keyboard.KeyCode) and other.char == char
+        )
+    return lambda other: other == key
+
 
 class HotkeyListener:
     """Listens for global hotkeys on macOS."""
@@ -20,6 +58,30 @@ class HotkeyListener:
         "shift": keyboard.Key.shift,
     }
 
+    # One bit per canonical modifier; held modifiers pack into a single
+    # int so the subset test is one AND-compare instead of set hashing
+    _CMD_BIT, _CTRL_BIT, _ALT_BIT, _SHIFT_BIT = 1, 2, 4, 8
+    _MOD_BIT: Mapping[keyboard.Key, int] = MappingProxyType({
+        keyboard.Key.cmd: _CMD_BIT,
+        keyboard.Key.ctrl: _CTRL_BIT,
+        keyboard.Key.alt: _ALT_BIT,
+        keyboard.Key.shift: _SHIFT_BIT,
+    })
+
+    # Left/right modifier variants mapped straight to their bit, so the
+    # per-keystroke handlers do one dict lookup instead of a branch
+    # chain; read-only so nothing can perturb the lookup table at runtime
+    _MOD_BITS: Mapping[keyboard.Key, int] = MappingProxyType({
+        variant: bit
+        for bit, variants in (
+            (_CMD_BIT, (keyboard.Key.cmd, keyboard.Key.cmd_l, keyboard.Key.cmd_r)),
+            (_CTRL_BIT, (keyboard.Key.ctrl, keyboard.Key.ctrl_l, keyboard.Key.ctrl_r)),
+            (_ALT_BIT, (keyboard.Key.alt, keyboard.Key.alt_l, keyboard.Key.alt_r)),
+            (_SHIFT_BIT, (keyboard.Key.shift, keyboard.Key.shift_l, keyboard.Key.shift_r)),
+        )
+        for variant in variants
+    })
+
     def __init__(
         self,
         hotkey: str = "cmd+shift+space",
@@ -44,14 +106,35 @@ class HotkeyListener:
 
         self._parse_hotkey(hotkey)
         self._parse_stop_key(stop_key)
+        self._build_fast_path()
 
         self._listener: Optional[keyboard.Listener] = None
-        self._pressed_modifiers: Set[keyboard.Key] = set()
+        self._pressed_mask = 0
         self._hotkey_active = False
         self._toggle_state = False
         self._recording_active = False  # Track if we're actively recording (for separate_keys mode)
+        # Guards start/stop only; the event handlers run single-threaded
+        # on pynput's listener thread, so they stay lock-free
         self._lock = threading.Lock()
 
+        # One long-lived worker runs the callbacks, so the listener
+        # thread only enqueues (spawning a thread per hotkey edge costs
+        # hundreds of microseconds and loses press/release ordering)
+        self._cb_queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._cb_worker = threading.Thread(
+            target=self._cb_loop, daemon=True, name="hotkey-callbacks"
+        )
+        self._cb_worker.start()
+
+    def _cb_loop(self) -> None:
+        """Run queued hotkey callbacks in order, off the listener thread."""
+        while True:
+            callback = self._cb_queue.get()
+            try:
+                callback()
+            except Exception as e:
+                print(f"Hotkey callback error: {e}")
+
     def _parse_hotkey(self, hotkey: str) -> None:
         """Parse hotkey string into components.
 
@@ -60,29 +143,21 @@ class HotkeyListener:
         """
         parts = hotkey.lower().replace(" ", "").split("+")
 
-        self._required_modifiers: Set[keyboard.Key] = set()
+        modifiers: Set[keyboard.Key] = set()
         self._trigger_key: Optional[keyboard.Key] = None
 
         for part in parts:
             if part in self.MODIFIER_MAP:
-                self._required_modifiers.add(self.MODIFIER_MAP[part])
-            elif part == "space":
-                self._trigger_key = keyboard.Key.space
-            elif part == "tab":
-                self._trigger_key = keyboard.Key.tab
-            elif part == "enter":
-                self._trigger_key = keyboard.Key.enter
-            elif part == "esc":
-                self._trigger_key = keyboard.Key.esc
-            elif len(part) == 1:
-                # Single character key
-                self._trigger_key = keyboard.KeyCode.from_char(part)
+                modifiers.add(self.MODIFIER_MAP[part])
             else:
-                # Try as function key (f1-f12)
-                if part.startswith("f") and part[1:].isdigit():
-                    fn_num = int(part[1:])
-                    if 1 <= fn_num <= 12:
-                        self._trigger_key = getattr(keyboard.Key, part)
+                key = _parse_key(part)
+                if key is not None:
+                    self._trigger_key = key
+
+        # Frozen after parsing: modifiers packed into a bitmask, and the
+        # trigger comparison partially evaluated into a bound closure
+        self._required_mask = sum(self._MOD_BIT[m] for m in modifiers)
+        self._trigger_match = _make_matcher(self._trigger_key)
 
     def _parse_stop_key(self, stop_key: str) -> None:
         """Parse stop key string.
@@ -91,25 +166,35 @@ class HotkeyListener:
             stop_key: Stop key string like 'enter' or 'esc'
         """
         stop_key = stop_key.lower().replace(" ", "")
+        # Default to enter if the name is unknown
+        self._stop_key = _parse_key(stop_key) or keyboard.Key.enter
+        self._stop_match = _make_matcher(self._stop_key)
 
-        if stop_key == "space":
-            self._stop_key = keyboard.Key.space
-        elif stop_key == "tab":
-            self._stop_key = keyboard.Key.tab
-        elif stop_key == "enter":
-            self._stop_key = keyboard.Key.enter
-        elif stop_key == "esc":
-            self._stop_key = keyboard.Key.esc
-        elif len(stop_key) == 1:
-            self._stop_key = keyboard.KeyCode.from_char(stop_key)
-        else:
-            # Try as function key
-            if stop_key.startswith("f") and stop_key[1:].isdigit():
-                fn_num = int(stop_key[1:])
-                if 1 <= fn_num <= 12:
-                    self._stop_key = getattr(keyboard.Key, stop_key)
-            else:
-                self._stop_key = keyboard.Key.enter  # Default to enter
+    def _build_fast_path(self) -> None:
+        """Precompute the set of keys the handlers care about.
+
+        pynput delivers every system-wide keystroke; almost all of them
+        are neither a modifier, the trigger, nor the stop key, so the
+        handlers bail on a single set membership test.
+        """
+        keys = set(self._MOD_BITS)
+        chars = set()
+        for k in (self._trigger_key, self._stop_key):
+            if isinstance(k, keyboard.KeyCode):
+                chars.add(k.char)
+            elif k is not None:
+                keys.add(k)
+        self._interesting_keys = frozenset(keys)
+        self._interesting_chars = frozenset(chars)
+
+    def _is_interesting(self, key) -> bool:
+        """Fast-path check: can this key affect hotkey state at all?"""
+        if key in self._interesting_keys:
+            return True
+        return (
+            isinstance(key, keyboard.KeyCode)
+            and key.char in self._interesting_chars
+        )
 
     def _on_press(self, key) -> None:
         """Handle key press event.
@@ -117,59 +202,40 @@ class HotkeyListener:
         Args:
             key: The key that was pressed
         """
-        with self._lock:
-            # Track modifier keys
-            if isinstance(key, keyboard.Key):
-                if key in (
-                    keyboard.Key.cmd,
-                    keyboard.Key.cmd_l,
-                    keyboard.Key.cmd_r,
-                ):
-                    self._pressed_modifiers.add(keyboard.Key.cmd)
-                elif key in (
-                    keyboard.Key.ctrl,
-                    keyboard.Key.ctrl_l,
-                    keyboard.Key.ctrl_r,
-                ):
-                    self._pressed_modifiers.add(keyboard.Key.ctrl)
-                elif key in (
-                    keyboard.Key.alt,
-                    keyboard.Key.alt_l,
-                    keyboard.Key.alt_r,
-                ):
-                    self._pressed_modifiers.add(keyboard.Key.alt)
-                elif key in (
-                    keyboard.Key.shift,
-                    keyboard.Key.shift_l,
-                    keyboard.Key.shift_r,
-                ):
-                    self._pressed_modifiers.add(keyboard.Key.shift)
-
-            # For separate_keys mode, check if stop key is pressed while recording
-            if self.mode == "separate_keys" and self._recording_active:
-                if self._is_stop_key(key):
-                    self._recording_active = False
-                    self._trigger_release()
-                    return
-
-            # Check if hotkey combination is pressed
-            if self._is_hotkey_pressed(key):
-                if not self._hotkey_active:
-                    self._hotkey_active = True
-
-                    if self.mode == "toggle":
-                        self._toggle_state = not self._toggle_state
-                        if self._toggle_state:
-                            self._trigger_press()
-                        else:
-                            self._trigger_release()
-                    elif self.mode == "separate_keys":
-                        # Start recording only if not already recording
-                        if not self._recording_active:
-                            self._recording_active = True
-                            self._trigger_press()
-                    else:  # push_to_talk
+        if not self._is_interesting(key):
+            return
+
+        # Track modifier keys (KeyCode instances hash fine and simply
+        # miss the dict, so no isinstance check is needed)
+        bit = self._MOD_BITS.get(key)
+        if bit is not None:
+            self._pressed_mask |= bit
+
+        # For separate_keys mode, check if stop key is pressed while recording
+        if self.mode == "separate_keys" and self._recording_active:
+            if self._is_stop_key(key):
+                self._recording_active = False
+                self._trigger_release()
+                return
+
+        # Check if hotkey combination is pressed
+        if self._is_hotkey_pressed(key):
+            if not self._hotkey_active:
+                self._hotkey_active = True
+
+                if self.mode == "toggle":
+                    self._toggle_state = not self._toggle_state
+                    if self._toggle_state:
                         self._trigger_press()
+                    else:
+                        self._trigger_release()
+                elif self.mode == "separate_keys":
+                    # Start recording only if not already recording
+                    if not self._recording_active:
+                        self._recording_active = True
+                        self._trigger_press()
+                else:  # push_to_talk
+                    self._trigger_press()
 
     def _on_release(self, key) -> None:
         """Handle key release event.
@@ -177,50 +243,30 @@ class HotkeyListener:
         Args:
             key: The key that was released
         """
-        with self._lock:
-            # Track modifier keys
-            if isinstance(key, keyboard.Key):
-                if key in (
-                    keyboard.Key.cmd,
-                    keyboard.Key.cmd_l,
-                    keyboard.Key.cmd_r,
-                ):
-                    self._pressed_modifiers.discard(keyboard.Key.cmd)
-                elif key in (
-                    keyboard.Key.ctrl,
-                    keyboard.Key.ctrl_l,
-                    keyboard.Key.ctrl_r,
-                ):
-                    self._pressed_modifiers.discard(keyboard.Key.ctrl)
-                elif key in (
-                    keyboard.Key.alt,
-                    keyboard.Key.alt_l,
-                    keyboard.Key.alt_r,
-                ):
-                    self._pressed_modifiers.discard(keyboard.Key.alt)
-                elif key in (
-                    keyboard.Key.shift,
-                    keyboard.Key.shift_l,
-                    keyboard.Key.shift_r,
-                ):
-                    self._pressed_modifiers.discard(keyboard.Key.shift)
-
-            # Check if hotkey was released (for push_to_talk mode)
-            if self._hotkey_active:
-                if self.mode == "push_to_talk":
-                    # Trigger release when any part of hotkey is released
-                    if self._is_trigger_key(key) or not self._modifiers_held():
-                        self._hotkey_active = False
-                        self._trigger_release()
-                elif self.mode == "separate_keys":
-                    # Just reset hotkey_active, don't trigger release
-                    # (release happens on stop key press)
-                    if self._is_trigger_key(key):
-                        self._hotkey_active = False
-                else:  # toggle mode
-                    # Just reset hotkey_active, don't trigger release
-                    if self._is_trigger_key(key):
-                        self._hotkey_active = False
+        if not self._is_interesting(key):
+            return
+
+        # Track modifier keys
+        bit = self._MOD_BITS.get(key)
+        if bit is not None:
+            self._pressed_mask &= ~bit
+
+        # Check if hotkey was released (for push_to_talk mode)
+        if self._hotkey_active:
+            if self.mode == "push_to_talk":
+                # Trigger release when any part of hotkey is released
+                if self._is_trigger_key(key) or not self._modifiers_held():
+                    self._hotkey_active = False
+                    self._trigger_release()
+            elif self.mode == "separate_keys":
+                # Just reset hotkey_active, don't trigger release
+                # (release happens on stop key press)
+                if self._is_trigger_key(key):
+                    self._hotkey_active = False
+            else:  # toggle mode
+                # Just reset hotkey_active, don't trigger release
+                if self._is_trigger_key(key):
+                    self._hotkey_active = False
 
     def _is_hotkey_pressed(self, key) -> bool:
         """Check if the full hotkey combination is pressed.
@@ -231,12 +277,12 @@ class HotkeyListener:
         Returns:
             True if hotkey is pressed
         """
-        # Check if all required modifiers are held
-        if not self._required_modifiers.issubset(self._pressed_modifiers):
+        # Check the trigger key first: most events are not the trigger,
+        # so the subset test only runs when it could matter
+        if not self._is_trigger_key(key):
             return False
 
-        # Check if trigger key matches
-        return self._is_trigger_key(key)
+        return (self._pressed_mask & self._required_mask) == self._required_mask
 
     def _is_trigger_key(self, key) -> bool:
         """Check if key matches the trigger key.
@@ -247,15 +293,7 @@ class HotkeyListener:
         Returns:
             True if it's the trigger key
         """
-        if self._trigger_key is None:
-            return False
-
-        if isinstance(self._trigger_key, keyboard.Key):
-            return key == self._trigger_key
-        elif isinstance(self._trigger_key, keyboard.KeyCode):
-            if isinstance(key, keyboard.KeyCode):
-                return key.char == self._trigger_key.char
-        return False
+        return self._trigger_match(key)
 
     def _is_stop_key(self, key) -> bool:
         """Check if key matches the stop key.
@@ -266,15 +304,7 @@ class HotkeyListener:
         Returns:
             True if it's the stop key
         """
-        if not hasattr(self, '_stop_key') or self._stop_key is None:
-            return False
-
-        if isinstance(self._stop_key, keyboard.Key):
-            return key == self._stop_key
-        elif isinstance(self._stop_key, keyboard.KeyCode):
-            if isinstance(key, keyboard.KeyCode):
-                return key.char == self._stop_key.char
-        return False
+        return self._stop_match(key)
 
     def _modifiers_held(self) -> bool:
         """Check if all required modifiers are still held.
@@ -282,37 +312,38 @@ class HotkeyListener:
         Returns:
             True if all modifiers are held
         """
-        return self._required_modifiers.issubset(self._pressed_modifiers)
+        return (self._pressed_mask & self._required_mask) == self._required_mask
 
     def _trigger_press(self) -> None:
-        """Trigger the press callback."""
+        """Queue the press callback for the worker thread."""
         if self.on_press_callback:
-            # Run callback in separate thread to avoid blocking listener
-            threading.Thread(target=self.on_press_callback, daemon=True).start()
+            self._cb_queue.put_nowait(self.on_press_callback)
 
     def _trigger_release(self) -> None:
-        """Trigger the release callback."""
+        """Queue the release callback for the worker thread."""
         if self.on_release_callback:
-            threading.Thread(target=self.on_release_callback, daemon=True).start()
+            self._cb_queue.put_nowait(self.on_release_callback)
 
     def start(self) -> None:
         """Start listening for hotkeys."""
-        if self._listener is not None:
-            return
+        with self._lock:
+            if self._listener is not None:
+                return
 
-        self._listener = keyboard.Listener(
-            on_press=self._on_press,
-            on_release=self._on_release,
-        )
-        self._listener.start()
+            self._listener = keyboard.Listener(
+                on_press=self._on_press,
+                on_release=self._on_release,
+            )
+            self._listener.start()
 
     def stop(self) -> None:
         """Stop listening for hotkeys."""
-        if self._listener:
-            self._listener.stop()
-            self._listener = None
-            self._pressed_modifiers.clear()
-            self._hotkey_active = False
+        with self._lock:
+            if self._listener:
+                self._listener.stop()
+                self._listener = None
+                self._pressed_mask = 0
+                self._hotkey_active = False
 
     @property
     def is_running(self) -> bool:
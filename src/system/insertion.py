@@ -1,13 +1,42 @@
 """Text insertion into active applications."""
 
 import subprocess
+import threading
 import time
 from typing import Optional
 
+try:
+    from AppKit import NSPasteboard, NSPasteboardTypeString
+
+    HAS_APPKIT = True
+except ImportError:
+    HAS_APPKIT = False
+
+try:
+    from Quartz import (
+        CGEventCreateKeyboardEvent,
+        CGEventPost,
+        CGEventSetFlags,
+        kCGEventFlagMaskCommand,
+        kCGHIDEventTap,
+    )
+
+    HAS_QUARTZ = True
+except ImportError:
+    HAS_QUARTZ = False
+
+# Virtual keycode for 'v' on the ANSI layout
+_VK_V = 0x09
+
 
 class TextInserter:
     """Inserts text into the currently active application."""
 
+    # Idle window before the original clipboard is restored; rapid
+    # successive inserts cancel and reschedule (debounce), so a burst
+    # does one backup and one restore total
+    RESTORE_DELAY_SECONDS = 2.0
+
     def __init__(self, method: str = "auto"):
         """Initialize text inserter.
 
@@ -16,6 +45,29 @@ class TextInserter:
         """
         self.method = method
         self._clipboard_backup: Optional[str] = None
+        self._restore_timer: Optional[threading.Timer] = None
+        # In-process pasteboard handle; avoids a pbcopy/pbpaste
+        # fork+exec (~10-30ms each) per clipboard operation
+        self._pb = NSPasteboard.generalPasteboard() if HAS_APPKIT else None
+
+        # Prebuilt Cmd+V key events, posted in-process instead of
+        # spawning osascript per paste
+        self._paste_down = None
+        self._paste_up = None
+        if HAS_QUARTZ:
+            self._paste_down = CGEventCreateKeyboardEvent(None, _VK_V, True)
+            self._paste_up = CGEventCreateKeyboardEvent(None, _VK_V, False)
+            CGEventSetFlags(self._paste_down, kCGEventFlagMaskCommand)
+            CGEventSetFlags(self._paste_up, kCGEventFlagMaskCommand)
+
+        # Import pyautogui once up front: it drags in PIL/pyscreeze
+        # (hundreds of ms), which should not land on the first hotkey
+        try:
+            import pyautogui
+
+            self._pyautogui = pyautogui
+        except ImportError:
+            self._pyautogui = None
 
     def insert(self, text: str) -> bool:
         """Insert text into active application.
@@ -64,24 +116,32 @@ class TextInserter:
             True if successful
         """
         try:
-            # Backup current clipboard
-            self._clipboard_backup = self._get_clipboard()
-
-            # Set clipboard to our text
+            # Backup the clipboard only on the first insert of a burst;
+            # a pending restore means the backup is already ours
+            if self._restore_timer is not None:
+                self._restore_timer.cancel()
+                self._restore_timer = None
+            else:
+                self._clipboard_backup = self._get_clipboard()
+
+            # Set clipboard to our text and wait until the pasteboard
+            # actually has it (changeCount polling instead of a blind
+            # 50ms sleep; typically confirms within 1-2ms)
+            change_count = self._pasteboard_change_count()
             self._set_clipboard(text)
-
-            # Small delay to ensure clipboard is set
-            time.sleep(0.05)
+            self._await_clipboard_change(change_count)
 
             # Simulate Cmd+V to paste
             self._simulate_paste()
 
-            # Small delay before restoring
-            time.sleep(0.1)
-
-            # Restore clipboard (optional, can be disabled)
-            if self._clipboard_backup:
-                self._set_clipboard(self._clipboard_backup)
+            # Restore is deferred past an idle window instead of sleeping
+            # inline: the target app has long read the pasteboard by
+            # then, and consecutive inserts coalesce into one restore
+            self._restore_timer = threading.Timer(
+                self.RESTORE_DELAY_SECONDS, self._restore_clipboard
+            )
+            self._restore_timer.daemon = True
+            self._restore_timer.start()
 
             return True
 
@@ -90,6 +150,35 @@ class TextInserter:
             # Try fallback
             return self._insert_via_keystroke(text)
 
+    def _restore_clipboard(self) -> None:
+        """Timer callback: put the user's original clipboard back."""
+        self._restore_timer = None
+        if self._clipboard_backup:
+            self._set_clipboard(self._clipboard_backup)
+            self._clipboard_backup = None
+
+    def _pasteboard_change_count(self) -> Optional[int]:
+        """Current pasteboard changeCount, or None without AppKit."""
+        if self._pb is None:
+            return None
+        return self._pb.changeCount()
+
+    def _await_clipboard_change(self, previous_count: Optional[int]) -> None:
+        """Wait (briefly) until the pasteboard changeCount increments.
+
+        Args:
+            previous_count: changeCount before the write, or None to
+                fall back to a short fixed delay
+        """
+        if previous_count is None:
+            time.sleep(0.05)
+            return
+
+        for _ in range(10):
+            if self._pb.changeCount() != previous_count:
+                return
+            time.sleep(0.001)
+
     def _insert_via_keystroke(self, text: str) -> bool:
         """Insert text by simulating keystrokes.
 
@@ -99,12 +188,14 @@ class TextInserter:
         Returns:
             True if successful
         """
-        try:
-            import pyautogui
+        if self._pyautogui is None:
+            print("Keystroke insertion failed: pyautogui not installed")
+            return False
 
+        try:
             # pyautogui.write doesn't handle unicode well
             # Use pyperclip + hotkey instead for unicode
-            pyautogui.write(text, interval=0.01)
+            self._pyautogui.write(text, interval=0.01)
             return True
 
         except Exception as e:
@@ -117,6 +208,9 @@ class TextInserter:
         Returns:
             Clipboard text or None
         """
+        if self._pb is not None:
+            return self._pb.stringForType_(NSPasteboardTypeString)
+
         try:
             result = subprocess.run(
                 ["pbpaste"],
@@ -134,6 +228,11 @@ class TextInserter:
         Args:
             text: Text to set
         """
+        if self._pb is not None:
+            self._pb.clearContents()
+            self._pb.setString_forType_(text, NSPasteboardTypeString)
+            return
+
         subprocess.run(
             ["pbcopy"],
             input=text,
@@ -143,6 +242,11 @@ class TextInserter:
 
     def _simulate_paste(self) -> None:
         """Simulate Cmd+V paste keystroke."""
+        if self._paste_down is not None:
+            CGEventPost(kCGHIDEventTap, self._paste_down)
+            CGEventPost(kCGHIDEventTap, self._paste_up)
+            return
+
         try:
             # Use AppleScript for reliable paste
             script = '''
@@ -155,14 +259,18 @@ class TextInserter:
                 timeout=2,
                 capture_output=True,
             )
-        except Exception as e:
+        except Exception:
             # Fallback to pyautogui
-            import pyautogui
-
-            pyautogui.hotkey("command", "v")
+            if self._pyautogui is not None:
+                self._pyautogui.hotkey("command", "v")
 
     def type_text(self, text: str, interval: float = 0.01) -> bool:
-        """Type text character by character (slow but reliable).
+        """Type text via simulated keystrokes.
+
+        ASCII goes through a single pyautogui.write call (one C-level
+        loop instead of a Python-level press+sleep per character);
+        anything with non-ASCII characters, which write() drops, falls
+        back to the clipboard-paste path.
 
         Args:
             text: Text to type
@@ -171,12 +279,15 @@ class TextInserter:
         Returns:
             True if successful
         """
-        try:
-            import pyautogui
+        if not text.isascii():
+            return self._insert_via_clipboard(text)
 
-            for char in text:
-                pyautogui.press(char) if len(char) == 1 else None
-                time.sleep(interval)
+        if self._pyautogui is None:
+            print("Typing failed: pyautogui not installed")
+            return False
+
+        try:
+            self._pyautogui.write(text, interval=interval)
             return True
         except Exception as e:
             print(f"Typing failed: {e}")
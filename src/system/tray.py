@@ -4,6 +4,7 @@ import threading
 from typing import Callable, Optional
 
 import rumps
+from PyObjCTools import AppHelper
 
 
 class MenuBarApp(rumps.App):
@@ -14,6 +15,16 @@ class MenuBarApp(rumps.App):
     ICON_RECORDING = None
     ICON_PROCESSING = None
 
+    # (title, status item, record item) per state, built once so
+    # set_state assigns strings instead of re-formatting them
+    _STATE_TITLES = {
+        "idle": ("Dictation", "Status: Ready", "Start Recording"),
+        "recording": ("🔴 Recording", "Status: Recording...", "Stop Recording"),
+        "processing": ("⚙️ Processing", "Status: Processing...", "Processing..."),
+        "done": ("✓ Done", "Status: Done", "Start Recording"),
+        "error": ("❌ Error", "Status: Error", "Start Recording"),
+    }
+
     def __init__(
         self,
         on_toggle_recording: Optional[Callable[[], None]] = None,
@@ -56,6 +67,18 @@ class MenuBarApp(rumps.App):
         self._language = "auto"
         self._has_context = False
 
+        # Single reusable CFRunLoop timer for the done->idle reset,
+        # instead of a fresh OS thread per "done" transition. Only ever
+        # started from _apply_state, which runs in main-run-loop timer
+        # callbacks, so the NSTimer lands on a live run loop
+        self._idle_timer = rumps.Timer(self._go_idle, 1.5)
+
+        # set_state calls arrive from audio/transcription threads; they
+        # park the latest state here and a short coalescing timer applies
+        # it once, so a rapid transition burst costs one AppKit redraw
+        self._pending_state = None
+        self._apply_timer = rumps.Timer(self._apply_pending, 0.02)
+
         # Build menu
         self._build_menu()
 
@@ -228,7 +251,39 @@ class MenuBarApp(rumps.App):
         self.language_item.title = "Language: Spanish"
 
     def set_state(self, state: str, language: Optional[str] = None) -> None:
-        """Set the current state of the app.
+        """Set the current state of the app (coalesced).
+
+        Stores the latest state and schedules a single short timer to
+        apply it; transitions landing within the window collapse into
+        one UI update. set_state is called from background threads
+        (hotkey worker, transcription pipeline) and rumps.Timer.start
+        schedules its NSTimer on the calling thread's run loop — which
+        those threads never spin — so arming hops to the main run loop
+        via callAfter.
+
+        Args:
+            state: One of 'idle', 'recording', 'processing', 'done', 'error'
+            language: Detected language code (for display)
+        """
+        self._pending_state = (state, language)
+        AppHelper.callAfter(self._arm_apply_timer)
+
+    def _arm_apply_timer(self) -> None:
+        """(Re)start the coalescing apply timer (main thread only)."""
+        self._apply_timer.stop()
+        self._apply_timer.start()
+
+    def _apply_pending(self, timer) -> None:
+        """Timer callback: apply the most recent pending state."""
+        timer.stop()
+        pending = self._pending_state
+        if pending is None:
+            return
+        self._pending_state = None
+        self._apply_state(*pending)
+
+    def _apply_state(self, state: str, language: Optional[str] = None) -> None:
+        """Apply a state transition to the menu bar items.
 
         Args:
             state: One of 'idle', 'recording', 'processing', 'done', 'error'
@@ -236,30 +291,22 @@ class MenuBarApp(rumps.App):
         """
         self._state = state
 
-        # Update title/icon based on state
-        if state == "idle":
-            self.title = "Dictation"
-            self.status_item.title = "Status: Ready"
-            self.record_item.title = "Start Recording"
-        elif state == "recording":
-            self.title = "🔴 Recording"
-            self.status_item.title = "Status: Recording..."
-            self.record_item.title = "Stop Recording"
-        elif state == "processing":
-            self.title = "⚙️ Processing"
-            self.status_item.title = "Status: Processing..."
-            self.record_item.title = "Processing..."
-        elif state == "done":
-            lang_str = f" ({language})" if language else ""
-            self.title = "✓ Done"
-            self.status_item.title = f"Status: Done{lang_str}"
-            self.record_item.title = "Start Recording"
+        titles = self._STATE_TITLES.get(state)
+        if titles is None:
+            return
+
+        self.title, self.status_item.title, self.record_item.title = titles
+        if state == "done":
+            if language:
+                self.status_item.title = f"Status: Done ({language})"
             # Auto-reset to idle after a moment
-            threading.Timer(1.5, lambda: self.set_state("idle")).start()
-        elif state == "error":
-            self.title = "❌ Error"
-            self.status_item.title = "Status: Error"
-            self.record_item.title = "Start Recording"
+            self._idle_timer.stop()
+            self._idle_timer.start()
+
+    def _go_idle(self, timer) -> None:
+        """Timer callback: reset to idle after the done flash."""
+        timer.stop()
+        self._apply_state("idle")
 
     @property
     def language(self) -> Optional[str]:
@@ -1,11 +1,52 @@
 """Whisper transcription engine using faster-whisper."""
 
+import functools
+import os
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Iterator, Optional, Tuple
 
 import numpy as np
 from faster_whisper import WhisperModel
 
+try:
+    from faster_whisper import BatchedInferencePipeline
+except ImportError:  # older faster-whisper without the batched API
+    BatchedInferencePipeline = None
+
+
+def _physical_cores() -> int:
+    """Physical core count (SMT siblings contend on the GEMM units)."""
+    try:
+        import psutil
+
+        cores = psutil.cpu_count(logical=False)
+        if cores:
+            return cores
+    except ImportError:
+        pass
+    # Without psutil, assume two logical threads per core
+    return max(1, (os.cpu_count() or 2) // 2)
+
+
+@functools.lru_cache(maxsize=4)
+def _get_model(
+    model_name: str, device: str, compute_type: str, cpu_threads: int
+) -> WhisperModel:
+    """Shared WhisperModel instances keyed by (model, device, compute type).
+
+    Loading large-v3 costs seconds of disk I/O and weight unpacking, so
+    engine instances with the same configuration reuse one model instead
+    of reloading it.
+    """
+    return WhisperModel(
+        model_name,
+        device=device,
+        compute_type=compute_type,
+        cpu_threads=cpu_threads,
+        num_workers=1,
+    )
+
 
 @dataclass
 class TranscriptionResult:
@@ -20,12 +61,26 @@ class TranscriptionResult:
 class WhisperEngine:
     """Whisper-based speech recognition engine."""
 
+    # Tuned for dictation-style short utterances: shorter silence and
+    # pad windows than Silero's 500ms/200ms defaults mean less trailing
+    # audio buffered before a segment is released to the decoder
+    DEFAULT_VAD_PARAMETERS = {
+        "threshold": 0.5,
+        "min_silence_duration_ms": 250,
+        "speech_pad_ms": 100,
+        "min_speech_duration_ms": 150,
+        "max_speech_duration_s": 30,
+    }
+
     def __init__(
         self,
         model_name: str = "large-v3",
         device: str = "auto",
         compute_type: str = "float16",
         language: Optional[str] = None,
+        beam_size: int = 1,
+        best_of: int = 1,
+        vad_parameters: Optional[dict] = None,
     ):
         """Initialize Whisper engine.
 
@@ -34,12 +89,27 @@ class WhisperEngine:
             device: Device to use (auto, cpu, cuda, mps)
             compute_type: Compute type (float32, float16, int8)
             language: Language code or None for auto-detection
+            beam_size: Decoder beam width; 1 = greedy (default). Decoder
+                compute scales roughly linearly with this.
+            best_of: Candidates when sampling; only relevant above
+                temperature 0
+            vad_parameters: Silero VAD parameter overrides; merged over
+                DEFAULT_VAD_PARAMETERS
         """
         self.model_name = model_name
         self.device = device
         self.compute_type = compute_type
-        self.language = language
+        # DICTATION_LANGUAGE pins the language without a config change,
+        # skipping the per-utterance detection forward pass
+        self.language = language or os.environ.get("DICTATION_LANGUAGE") or None
+        self.beam_size = beam_size
+        self.best_of = best_of
+        self.vad_parameters = dict(self.DEFAULT_VAD_PARAMETERS)
+        if vad_parameters:
+            self.vad_parameters.update(vad_parameters)
         self._model: Optional[WhisperModel] = None
+        self._batched = None
+        self._detected_language: Optional[str] = None
 
     def _load_model(self) -> None:
         """Load Whisper model lazily."""
@@ -64,23 +134,50 @@ class WhisperEngine:
             except ImportError:
                 device = "cpu"
 
-        # Adjust compute_type for CPU (float16 not supported efficiently)
-        if device == "cpu" and compute_type == "float16":
+        # Validate the requested compute type against what the device
+        # actually supports and let CTranslate2 pick the fastest ("auto")
+        # when it isn't available (e.g. float16 on CPU, where int8
+        # quantized GEMMs are 2-4x faster than float32 anyway)
+        try:
+            import ctranslate2
+
+            supported = ctranslate2.get_supported_compute_types(device)
+        except Exception:
+            supported = None
+
+        if compute_type != "auto" and supported and compute_type not in supported:
+            print(
+                f"Compute type {compute_type} not supported on {device}; "
+                "letting CTranslate2 choose"
+            )
+            compute_type = "auto"
+        elif device == "cpu" and compute_type in ("float16", "float32"):
             compute_type = "int8"  # Best performance on CPU
-            print(f"Using int8 compute type for CPU (faster than float32)")
-
-        self._model = WhisperModel(
-            self.model_name,
-            device=device,
-            compute_type=compute_type,
-        )
-        print(f"Model loaded on {device} with {compute_type}")
+            print(f"Using int8 compute type for CPU (faster than {self.compute_type})")
+        elif device == "cuda" and compute_type == "float16":
+            # int8 weights + fp16 activations: ~60% less VRAM and ~1.5x
+            # faster than plain fp16 on large-v3 at the same WER
+            if not supported or "int8_float16" in supported:
+                compute_type = "int8_float16"
+                print("Using int8_float16 compute type for CUDA")
+
+        # Pin OpenMP and CT2 to physical cores; the default thread count
+        # can exceed them and SMT contention slows the encoder GEMMs
+        cpu_threads = _physical_cores()
+        os.environ.setdefault("OMP_NUM_THREADS", str(cpu_threads))
+
+        self._model = _get_model(self.model_name, device, compute_type, cpu_threads)
+        print(f"Whisper backend: CTranslate2 on {device} with {compute_type}")
 
     def transcribe(
         self,
         audio: np.ndarray,
         vad_filter: bool = True,
         vad_parameters: Optional[dict] = None,
+        beam_size: Optional[int] = None,
+        language: Optional[str] = None,
+        include_segments: bool = True,
+        pre_vaded: bool = False,
     ) -> TranscriptionResult:
         """Transcribe audio to text.
 
@@ -88,32 +185,159 @@ class WhisperEngine:
             audio: Audio samples as numpy array (float32, 16kHz, mono)
             vad_filter: Whether to use VAD filtering
             vad_parameters: VAD parameters dict
+            beam_size: Per-call beam width override (e.g. opt in to 5
+                for difficult long-form audio); defaults to the
+                engine's greedy setting
+            language: Per-call language override (skips detection);
+                defaults to the engine's configured language
+            include_segments: Whether to materialize per-segment dicts;
+                pass False when only the text is needed to skip the
+                per-segment allocations
+            pre_vaded: Audio was already VAD-trimmed upstream; skips
+                faster-whisper's internal Silero pass entirely
 
         Returns:
             TranscriptionResult with text and metadata
         """
         self._load_model()
 
-        if vad_parameters is None:
-            vad_parameters = {
-                "min_silence_duration_ms": 500,
-                "speech_pad_ms": 200,
-            }
+        if pre_vaded:
+            vad_filter = False
 
+        # CTranslate2's StorageView constructor silently copies
+        # non-contiguous or non-float32 input; normalizing here makes
+        # that a no-op for well-formed buffers
+        audio = np.ascontiguousarray(audio, dtype=np.float32)
+
+        if vad_parameters is None:
+            vad_parameters = self.vad_parameters
+
+        # Greedy decoding with a single temperature: the list form
+        # [0.0] disables the fallback cascade outright, so a segment
+        # failing the quality thresholds can never trigger the 10-30x
+        # slowdown of re-decoding at rising temperatures. The thresholds
+        # are pinned to Whisper's defaults so library upgrades can't
+        # change retry behavior under us, and
+        # condition_on_previous_text=False keeps one bad segment from
+        # poisoning (and slowing) the ones after it.
         segments, info = self._model.transcribe(
             audio,
-            language=self.language,
+            language=language or self.language,
             vad_filter=vad_filter,
             vad_parameters=vad_parameters,
-            beam_size=5,
-            best_of=5,
-            temperature=0.0,
+            beam_size=beam_size or self.beam_size,
+            best_of=self.best_of,
+            temperature=[0.0],
+            compression_ratio_threshold=2.4,
+            log_prob_threshold=-1.0,
+            no_speech_threshold=0.6,
+            condition_on_previous_text=False,
         )
 
-        # Collect all segments
+        # Collect all segments (the generator streams from the decoder;
+        # the text-only path skips one dict per segment)
         segment_list = []
-        text_parts = []
+        if include_segments:
+            text_parts = []
+            for segment in segments:
+                segment_list.append(
+                    {
+                        "start": segment.start,
+                        "end": segment.end,
+                        "text": segment.text,
+                        "avg_logprob": segment.avg_logprob,
+                    }
+                )
+                text_parts.append(segment.text)
+            full_text = "".join(text_parts).strip()
+        else:
+            full_text = "".join(s.text for s in segments).strip()
+
+        return TranscriptionResult(
+            text=full_text,
+            language=info.language,
+            language_probability=info.language_probability,
+            segments=segment_list,
+        )
+
+    def transcribe_text(self, audio: np.ndarray, **kwargs) -> str:
+        """Transcribe audio and return only the text.
+
+        Convenience wrapper around transcribe(include_segments=False)
+        for callers that never look at segment metadata.
+
+        Args:
+            audio: Audio samples as numpy array
+            **kwargs: Forwarded to transcribe()
+
+        Returns:
+            Transcribed text
+        """
+        return self.transcribe(audio, include_segments=False, **kwargs).text
+
+    def detect_language_once(self, audio: np.ndarray) -> Optional[str]:
+        """Detect the spoken language once and cache it.
+
+        Runs detection on the first 30s only; repeat callers (e.g. the
+        streaming loop, which would otherwise re-detect per chunk) get
+        the cached answer. A configured language short-circuits
+        detection entirely.
+
+        Args:
+            audio: Audio samples as numpy array
+
+        Returns:
+            Language code, or None if detection wasn't possible
+        """
+        if self.language:
+            return self.language
+        if self._detected_language is None:
+            self._load_model()
+            # info (with the detected language) is computed eagerly;
+            # the lazy segments generator is never consumed
+            _, info = self._model.transcribe(
+                audio[: 30 * 16000], vad_filter=False, beam_size=1
+            )
+            self._detected_language = info.language
+        return self._detected_language
+
+    def transcribe_batched(
+        self,
+        audio: np.ndarray,
+        batch_size: int = 8,
+    ) -> TranscriptionResult:
+        """Transcribe using faster-whisper's batched pipeline.
 
+        BatchedInferencePipeline VAD-segments the audio itself and feeds
+        several speech regions through the encoder at once, amortizing
+        kernel launches (2-4x on GPU, ~1.5x on many-core CPU for long
+        recordings). Falls back to the thread-sliced path on older
+        faster-whisper versions without the API.
+
+        Args:
+            audio: Audio samples as numpy array (float32, 16kHz, mono)
+            batch_size: Number of speech segments decoded per batch
+
+        Returns:
+            TranscriptionResult covering the whole recording
+        """
+        self._load_model()
+
+        if BatchedInferencePipeline is None:
+            return self.transcribe_parallel(audio)
+
+        if self._batched is None:
+            self._batched = BatchedInferencePipeline(model=self._model)
+
+        segments, info = self._batched.transcribe(
+            audio,
+            language=self.language,
+            batch_size=batch_size,
+            beam_size=self.beam_size,
+        )
+
+        segment_list = []
+        text_parts = []
         for segment in segments:
             segment_list.append(
                 {
@@ -125,15 +349,87 @@ class WhisperEngine:
             )
             text_parts.append(segment.text)
 
-        full_text = "".join(text_parts).strip()
-
         return TranscriptionResult(
-            text=full_text,
+            text="".join(text_parts).strip(),
             language=info.language,
             language_probability=info.language_probability,
             segments=segment_list,
         )
 
+    def transcribe_parallel(
+        self,
+        audio: np.ndarray,
+        n_workers: Optional[int] = None,
+        min_chunk_seconds: float = 10.0,
+    ) -> TranscriptionResult:
+        """Transcribe a long recording by splitting it across threads.
+
+        The audio is cut at the quietest point near each even split so
+        words are not sliced mid-phoneme, and the slices run concurrently
+        against the same loaded weights (CTranslate2 releases the GIL
+        during inference). Intended for recordings of 30s or more, where
+        single-call latency is dominated by sequential decoder steps.
+
+        Args:
+            audio: Audio samples as numpy array (float32, 16kHz, mono)
+            n_workers: Number of parallel slices (default: cpu_count, max 4)
+            min_chunk_seconds: Minimum duration of each slice
+
+        Returns:
+            TranscriptionResult covering the whole recording
+        """
+        self._load_model()
+
+        sample_rate = 16000
+        if n_workers is None:
+            n_workers = min(4, os.cpu_count() or 1)
+        n_chunks = min(
+            n_workers, max(1, int(len(audio) / (min_chunk_seconds * sample_rate)))
+        )
+        if n_chunks <= 1:
+            return self.transcribe(audio)
+
+        # Find a low-energy cut point within ±1s of each even split
+        search = sample_rate
+        win = int(0.03 * sample_rate)  # 30ms energy windows
+        boundaries = [0]
+        for i in range(1, n_chunks):
+            target = len(audio) * i // n_chunks
+            lo = max(boundaries[-1] + win, target - search)
+            hi = min(len(audio) - win, target + search)
+            if lo >= hi:
+                boundaries.append(target)
+                continue
+            seg = audio[lo:hi]
+            n_win = len(seg) // win
+            energies = (seg[: n_win * win].reshape(n_win, win) ** 2).mean(axis=1)
+            boundaries.append(lo + int(energies.argmin()) * win + win // 2)
+        boundaries.append(len(audio))
+
+        with ThreadPoolExecutor(max_workers=n_chunks) as pool:
+            futures = [
+                pool.submit(self.transcribe, audio[start:end])
+                for start, end in zip(boundaries, boundaries[1:])
+            ]
+            results = [f.result() for f in futures]
+
+        # Reassemble, offsetting segment times back to the full recording
+        segment_list = []
+        for result, start in zip(results, boundaries):
+            offset = start / sample_rate
+            for seg in result.segments:
+                seg["start"] += offset
+                seg["end"] += offset
+                segment_list.append(seg)
+
+        first = results[0]
+        return TranscriptionResult(
+            text=" ".join(r.text for r in results if r.text).strip(),
+            language=first.language,
+            language_probability=first.language_probability,
+            segments=segment_list,
+        )
+
     def transcribe_stream(
         self, audio: np.ndarray, chunk_duration: float = 5.0
     ) -> Iterator[Tuple[str, str]]:
@@ -151,12 +447,15 @@ class WhisperEngine:
         sample_rate = 16000
         chunk_size = int(chunk_duration * sample_rate)
 
+        # Detect the language once up front rather than per chunk
+        language = self.detect_language_once(audio)
+
         for i in range(0, len(audio), chunk_size):
             chunk = audio[i : i + chunk_size]
             if len(chunk) < sample_rate:  # Skip chunks < 1 second
                 continue
 
-            result = self.transcribe(chunk, vad_filter=False)
+            result = self.transcribe(chunk, vad_filter=False, language=language)
             yield result.text, result.language
 
     @property
@@ -167,3 +466,9 @@ class WhisperEngine:
     def preload(self) -> None:
         """Preload the model."""
         self._load_model()
+
+    def release(self) -> None:
+        """Drop the model and evict the shared cache to free memory."""
+        self._model = None
+        self._batched = None
+        _get_model.cache_clear()
@@ -3,6 +3,16 @@
 import re
 from typing import Dict, Optional
 
+# Whitespace cleanup patterns, compiled once at import
+_RE_MULTISPACE = re.compile(r" +")
+# Space before punctuation removed and exactly one space ensured after,
+# in a single pass (trailing/pre-newline cases handled by the
+# lookahead: no space is inserted at end of text or before whitespace)
+_RE_PUNCT_SPACING = re.compile(r"\s*([.,;:!?])(?!\s|$)(?!\.)")
+_RE_PUNCT_TRAIL = re.compile(r"\s+([.,;:!?])")
+_RE_NEWLINE_PAD = re.compile(r" *\n *")
+_RE_NEWLINE_RUNS = re.compile(r"\n{3,}")
+
 
 class TextProcessor:
     """Processes transcribed text with voice commands and cleanup."""
@@ -78,15 +88,37 @@ class TextProcessor:
         self.enable_commands = enable_commands
         self.auto_capitalize = auto_capitalize
 
-        # Merge default and custom commands
+        # Merge default and custom commands. Keys are lowercased (as
+        # add_command does) so the IGNORECASE match's .lower() lookup
+        # always hits, whatever the config file used
         self.commands = self.DEFAULT_COMMANDS.copy()
         if custom_commands:
-            self.commands.update(custom_commands)
+            self.commands.update(
+                {trigger.lower(): v for trigger, v in custom_commands.items()}
+            )
+
+        self._rebuild_pattern()
 
+    def _rebuild_pattern(self) -> None:
+        """Compile all commands into one alternation pattern.
+
+        Longest-first ordering preserves longest-match semantics (the
+        regex engine tries alternatives in order), and a single compiled
+        pattern means one C-level pass over the text instead of one
+        compile + full scan per command.
+        """
+        self._pattern_dirty = False
         # Sort commands by length (longest first) to avoid partial matches
         self._sorted_commands = sorted(
             self.commands.keys(), key=len, reverse=True
         )
+        if self._sorted_commands:
+            self._commands_re = re.compile(
+                "|".join(re.escape(c) for c in self._sorted_commands),
+                re.IGNORECASE,
+            )
+        else:
+            self._commands_re = None
 
     def process(self, text: str, language: Optional[str] = None) -> str:
         """Process transcribed text.
@@ -125,16 +157,15 @@ class TextProcessor:
         Returns:
             Text with commands replaced
         """
-        result = text
-
-        for command in self._sorted_commands:
-            replacement = self.commands[command]
+        if self._pattern_dirty:
+            self._rebuild_pattern()
 
-            # Case-insensitive replacement
-            pattern = re.compile(re.escape(command), re.IGNORECASE)
-            result = pattern.sub(replacement, result)
+        if self._commands_re is None:
+            return text
 
-        return result
+        return self._commands_re.sub(
+            lambda m: self.commands[m.group(0).lower()], text
+        )
 
     def _clean_whitespace(self, text: str) -> str:
         """Clean up whitespace in text.
@@ -146,17 +177,17 @@ class TextProcessor:
             Text with cleaned whitespace
         """
         # Remove multiple spaces
-        result = re.sub(r" +", " ", text)
-
-        # Remove spaces before punctuation
-        result = re.sub(r"\s+([.,;:!?])", r"\1", result)
+        result = _RE_MULTISPACE.sub(" ", text)
 
-        # Ensure space after punctuation (except at end or before newline)
-        result = re.sub(r"([.,;:!?])([^\s\n])", r"\1 \2", result)
+        # Fused pass: drop space before punctuation and ensure one
+        # space after it (except at end, before whitespace, or inside
+        # an ellipsis)
+        result = _RE_PUNCT_SPACING.sub(r"\1 ", result)
+        result = _RE_PUNCT_TRAIL.sub(r"\1", result)
 
         # Clean up around newlines
-        result = re.sub(r" *\n *", "\n", result)
-        result = re.sub(r"\n{3,}", "\n\n", result)
+        result = _RE_NEWLINE_PAD.sub("\n", result)
+        result = _RE_NEWLINE_RUNS.sub("\n\n", result)
 
         return result.strip()
 
@@ -172,19 +203,26 @@ class TextProcessor:
         if not text:
             return ""
 
-        # Capitalize first character
-        result = text[0].upper() + text[1:] if len(text) > 1 else text.upper()
-
-        # Capitalize after sentence endings
-        def capitalize_after(match):
-            return match.group(1) + match.group(2).upper()
-
-        result = re.sub(r"([.!?]\s+)([a-záéíóúñ])", capitalize_after, result)
-
-        # Capitalize after newlines
-        result = re.sub(r"(\n)([a-záéíóúñ])", capitalize_after, result)
-
-        return result
+        # Single O(N) pass: flag flips on sentence enders/newlines and
+        # uppercases the next letter. No regex engine, and no Python
+        # callback round-trip per match like re.sub(..., func) costs.
+        out = []
+        capitalize_next = True
+        for ch in text:
+            if capitalize_next and ch.isalpha():
+                out.append(ch.upper())
+                capitalize_next = False
+            else:
+                out.append(ch)
+                if ch in ".!?\n":
+                    capitalize_next = True
+                elif not ch.isspace():
+                    # The flag only survives whitespace: a digit or
+                    # symbol after a period (as in "3.5") means that
+                    # period did not end a sentence
+                    capitalize_next = False
+
+        return "".join(out)
 
     def add_command(self, trigger: str, replacement: str) -> None:
         """Add a custom voice command.
@@ -194,9 +232,7 @@ class TextProcessor:
             replacement: Text to replace it with
         """
         self.commands[trigger.lower()] = replacement
-        self._sorted_commands = sorted(
-            self.commands.keys(), key=len, reverse=True
-        )
+        self._pattern_dirty = True
 
     def remove_command(self, trigger: str) -> None:
         """Remove a voice command.
@@ -207,6 +243,4 @@ class TextProcessor:
         trigger_lower = trigger.lower()
         if trigger_lower in self.commands:
             del self.commands[trigger_lower]
-            self._sorted_commands = sorted(
-                self.commands.keys(), key=len, reverse=True
-            )
+            self._pattern_dirty = True
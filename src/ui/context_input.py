@@ -14,6 +14,7 @@ try:
         NSColor,
         NSFont,
         NSMakeRect,
+        NSMakeSize,
         NSTextField,
         NSTextView,
         NSScrollView,
@@ -48,9 +49,9 @@ class ContextInputWindow:
         self._window = None
         self._text_view = None
         self._current_context = ""
-
-        if HAS_APPKIT:
-            self._setup_window()
+        # NSWindow/NSTextView construction is deferred to the first
+        # show(): most sessions never open this dialog, so startup
+        # shouldn't pay for its AppKit object graph
 
     def _setup_window(self) -> None:
         """Set up the context input window using AppKit."""
@@ -109,8 +110,8 @@ class ContextInputWindow:
         # Text view
         text_rect = NSMakeRect(0, 0, scroll_rect.size.width - 20, scroll_rect.size.height)
         self._text_view = NSTextView.alloc().initWithFrame_(text_rect)
-        self._text_view.setMinSize_(NSMakeRect(0, 0, scroll_rect.size.width - 20, scroll_rect.size.height).size)
-        self._text_view.setMaxSize_(NSMakeRect(0, 0, 10000, 10000).size)
+        self._text_view.setMinSize_(NSMakeSize(scroll_rect.size.width - 20, scroll_rect.size.height))
+        self._text_view.setMaxSize_(NSMakeSize(10000, 10000))
         self._text_view.setVerticallyResizable_(True)
         self._text_view.setHorizontallyResizable_(False)
         self._text_view.setFont_(NSFont.systemFontOfSize_(13))
@@ -160,11 +161,15 @@ class ContextInputWindow:
         Args:
             current_context: Current context text to display
         """
-        if not HAS_APPKIT or not self._window:
+        if not HAS_APPKIT:
             print("AppKit not available, cannot show context window")
             return
 
         def _show():
+            # Build the window lazily on first show
+            if self._window is None:
+                self._setup_window()
+
             # Set current context
             if self._text_view:
                 self._text_view.setString_(current_context or "")
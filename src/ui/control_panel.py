@@ -1,11 +1,22 @@
 """Standalone control panel window for dictation app settings."""
 
+import copy
+import os
+import re
+import subprocess
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Callable, List, Optional
 from pathlib import Path
 import yaml
 
+try:
+    # libyaml C bindings: 5-20x faster than the pure-Python loader
+    from yaml import CSafeLoader as _YamlLoader, CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader, SafeDumper as _YamlDumper
+
 try:
     from AppKit import (
         NSApplication,
@@ -19,6 +30,7 @@ try:
         NSColor,
         NSFont,
         NSMakeRect,
+        NSMakeSize,
         NSTextField,
         NSButton,
         NSScreen,
@@ -32,13 +44,25 @@ try:
         NSTableColumn,
         NSScrollView,
         NSTableViewStylePlain,
+        NSTableCellView,
+        NSTableRowView,
+        NSAnimationContext,
+        NSPasteboard,
+        NSPasteboardTypeString,
     )
-    from Foundation import NSObject
+    from Foundation import NSObject, NSIndexSet, NSMakeRange
 
     HAS_APPKIT = True
 except ImportError:
     HAS_APPKIT = False
 
+try:
+    from Quartz import CATransaction
+
+    HAS_CATRANSACTION = True
+except ImportError:
+    HAS_CATRANSACTION = False
+
 try:
     import pyperclip
     HAS_PYPERCLIP = True
@@ -53,9 +77,185 @@ except ImportError:
     HAS_HISTORY = False
 
 
+if HAS_APPKIT:
+    # Shared font objects; every NSFont.systemFontOfSize_ call crosses
+    # the ObjC bridge, so the handful of sizes used here are made once
+    _FONT_BOLD_18 = NSFont.boldSystemFontOfSize_(18)
+    _FONT_BOLD_14 = NSFont.boldSystemFontOfSize_(14)
+    _FONT_14 = NSFont.systemFontOfSize_(14)
+    _FONT_13 = NSFont.systemFontOfSize_(13)
+    _FONT_12 = NSFont.systemFontOfSize_(12)
+    _FONT_11 = NSFont.systemFontOfSize_(11)
+    _FONT_10 = NSFont.systemFontOfSize_(10)
+    # Dynamic NSColor objects resolve per-appearance at draw time, so
+    # caching the instance is safe and skips a bridge call per use
+    _COLOR_SECONDARY = NSColor.secondaryLabelColor()
+
+    class _OpaqueRowView(NSTableRowView):
+        """Opaque history row: the compositor can skip alpha blending."""
+
+        def isOpaque(self):
+            return True
+
+    class _HistoryDataSource(NSObject):
+        """Data source/delegate for the view-based history table.
+
+        Visible rows reuse cells via makeViewWithIdentifier:owner:, so
+        a refresh is a reloadData() instead of tearing down and
+        reallocating one subview tree per entry.
+        """
+
+        panel = None
+
+        def numberOfRowsInTableView_(self, tableView):
+            entries = self.panel._history_entries
+            # One placeholder row when empty, so the panel still shows
+            # the "no history" message
+            return max(1, len(entries))
+
+        def tableView_rowViewForRow_(self, tableView, row):
+            rowView = tableView.makeViewWithIdentifier_owner_("HistoryRow", None)
+            if rowView is None:
+                rowView = _OpaqueRowView.alloc().init()
+                rowView.setIdentifier_("HistoryRow")
+                # Solid fill behind the row so isOpaque holds and the
+                # compositor never redraws the container underneath
+                rowView.setBackgroundColor_(NSColor.controlBackgroundColor())
+            return rowView
+
+        def tableView_viewForTableColumn_row_(self, tableView, column, row):
+            width = tableView.frame().size.width
+            cell = tableView.makeViewWithIdentifier_owner_("HistoryCell", None)
+            if cell is None:
+                cell = NSTableCellView.alloc().initWithFrame_(
+                    NSMakeRect(0, 0, width, 55)
+                )
+                cell.setIdentifier_("HistoryCell")
+
+                text_label = NSTextField.alloc().initWithFrame_(
+                    NSMakeRect(5, 22, width - 80, 30)
+                )
+                text_label.setBezeled_(False)
+                text_label.setDrawsBackground_(False)
+                text_label.setEditable_(False)
+                text_label.setSelectable_(True)
+                text_label.setFont_(_FONT_11)
+                text_label.setLineBreakMode_(4)  # NSLineBreakByTruncatingTail
+                cell.addSubview_(text_label)
+                cell.setTextField_(text_label)
+
+                meta_label = NSTextField.alloc().initWithFrame_(
+                    NSMakeRect(5, 5, width - 80, 18)
+                )
+                meta_label.setBezeled_(False)
+                meta_label.setDrawsBackground_(False)
+                meta_label.setEditable_(False)
+                meta_label.setSelectable_(False)
+                meta_label.setFont_(_FONT_10)
+                meta_label.setTextColor_(_COLOR_SECONDARY)
+                meta_label.setTag_(101)
+                cell.addSubview_(meta_label)
+
+                copy_btn = NSButton.alloc().initWithFrame_(
+                    NSMakeRect(width - 70, 15, 60, 25)
+                )
+                copy_btn.setTitle_("Copy")
+                copy_btn.setBezelStyle_(NSBezelStyleRounded)
+                copy_btn.setFont_(_FONT_11)
+                copy_btn.setTag_(102)
+                cell.addSubview_(copy_btn)
+
+            text_label = cell.textField()
+            meta_label = cell.viewWithTag_(101)
+            copy_btn = cell.viewWithTag_(102)
+
+            entries = self.panel._history_entries
+            if not entries:
+                if HAS_HISTORY:
+                    text_label.setStringValue_(
+                        "No history yet - dictate something!"
+                    )
+                else:
+                    text_label.setStringValue_("History module not available")
+                meta_label.setStringValue_("")
+                copy_btn.setHidden_(True)
+                return cell
+
+            entry = entries[row]
+
+            # Entries are immutable, so the rendered lines are built
+            # once on first display and reused on later refreshes
+            # (cells re-render every time a row scrolls into view)
+            display_line = getattr(entry, "_display_line", None)
+            if display_line is None:
+                # HistoryEntry caches display_time at construction; the
+                # fallback covers entries from older module versions
+                time_str = getattr(entry, "display_time", None)
+                if time_str is None:
+                    try:
+                        time_str = datetime.fromisoformat(
+                            entry.timestamp
+                        ).strftime("%m/%d %H:%M")
+                    except (ValueError, AttributeError):
+                        time_str = "Unknown"
+
+                display_text = entry.text[:80]
+                if len(entry.text) > 80:
+                    display_text += "..."
+
+                mode_indicator = _MODE_ICON.get(entry.mode, _DEFAULT_ICON)
+                lang_str = f" ({entry.language})" if entry.language else ""
+
+                display_line = f"{mode_indicator} {display_text}"
+                entry._display_line = display_line
+                entry._meta_line = f"{time_str}{lang_str}"
+
+            text_label.setStringValue_(display_line)
+            meta_label.setStringValue_(entry._meta_line)
+            copy_btn.setHidden_(False)
+            copy_btn.setTarget_(self.panel)
+            copy_btn.setAction_("copyHistoryItem:")
+            return cell
+
+
+# History row mode icons, looked up instead of branching per row
+_MODE_ICON = {"drafting": "✨"}
+_DEFAULT_ICON = "📝"
+
+
+# Zero or more modifier prefixes followed by a key name, e.g.
+# "cmd+shift+space" or "enter". Validated once per edit so typos never
+# reach the config file or the settings callback.
+_HOTKEY_RE = re.compile(r"^(?:(?:cmd|ctrl|alt|shift)\+)*[a-z0-9_]+$", re.IGNORECASE)
+
+
+# Parsed config cache keyed by (path, mtime_ns). YAML tokenization is
+# pure Python and far slower than a stat(); repeated panel constructions
+# against an unchanged file skip the parse entirely.
+_CONFIG_CACHE: dict = {}
+
+
 class ControlPanelWindow:
     """Standalone control panel for dictation app settings."""
 
+    # Debounce window for config writes; rapid popup/field changes
+    # coalesce into a single YAML dump
+    SAVE_DEBOUNCE_SECONDS = 0.25
+
+    # Debounce window for on_settings_change callbacks; rapid edits
+    # merge into one delta instead of thrashing downstream reconfigs
+    SETTINGS_DEBOUNCE_SECONDS = 0.3
+
+    # (status text, record-button title, button enabled) per state;
+    # "done" appends the detected language to the status at runtime
+    _STATE_TABLE = {
+        "idle": ("Status: Ready", "Start Recording", True),
+        "recording": ("Status: Recording...", "Stop Recording", True),
+        "processing": ("Status: Processing...", "Processing...", False),
+        "done": ("Status: Done", "Start Recording", True),
+        "error": ("Status: Error", "Start Recording", True),
+    }
+
     def __init__(
         self,
         on_toggle_recording: Optional[Callable[[], None]] = None,
@@ -93,37 +293,174 @@ class ControlPanelWindow:
         self._stop_key_field = None
         self._state = "idle"
         self._has_context = False
-
-        # History UI elements
-        self._history_list_view = None
-        self._history_buttons: List[NSButton] = []
-        self._history_container = None
-        self._selected_history_index = -1
-
-        # Load current config
-        self._load_config()
-
-        if HAS_APPKIT:
-            self._setup_window()
+        self._save_timer: Optional[threading.Timer] = None
+        # Single-worker pool keeps config writes ordered and off the
+        # main thread (AppKit actions fire there)
+        self._io_pool = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="config-io"
+        )
+        self._last_save = None
+        self._pending_settings: dict = {}
+        self._settings_timer: Optional[threading.Timer] = None
+        # Bursty state flips coalesce into one main-thread flush
+        self._pending_ui: dict = {}
+        self._ui_flush_scheduled = False
+        # Last values actually applied to the views; repeat updates
+        # with identical values skip the setters (and their redraws)
+        self._applied_state = None
+        self._applied_context = None
+
+        # History UI elements (table built lazily on first show)
+        self._history_scroll = None
+        self._history_table = None
+        self._history_datasource = None
+        self._history_entries: List = []
+        self._history_keys: List = []
+        self._history_built = False
+        self._history_dirty = True
+        # Resolved on first use so construction stays off the history
+        # file; afterwards refreshes cost one attribute load
+        self._history = None
+
+        # Config is parsed lazily on first access (see _config); the
+        # window build is deferred to first show() so constructing the
+        # panel triggers neither the YAML parse nor AppKit work
+        self._config_data = None
+
+    @property
+    def _config(self):
+        """Parsed configuration, loaded lazily on first access."""
+        if self._config_data is None:
+            self._load_config()
+        return self._config_data
 
     def _load_config(self):
-        """Load current configuration from file."""
+        """Load current configuration from file (cached by mtime)."""
         try:
+            key = (self.config_path, os.stat(self.config_path).st_mtime_ns)
+            cached = _CONFIG_CACHE.get(key)
+            if cached is not None:
+                # Deep copy so in-place edits don't corrupt the cache
+                self._config_data = copy.deepcopy(cached)
+                return
             with open(self.config_path, 'r') as f:
-                self._config = yaml.safe_load(f) or {}
+                self._config_data = yaml.load(f, Loader=_YamlLoader) or {}
+            _CONFIG_CACHE.clear()
+            _CONFIG_CACHE[key] = copy.deepcopy(self._config_data)
         except Exception:
-            self._config = {}
+            self._config_data = {}
+
+    def _schedule_save(self):
+        """Debounce a config write (cancel + restart pattern).
+
+        Each settings handler used to rewrite the whole YAML file
+        synchronously; toggling through popups cost one disk write per
+        click. Changes now coalesce into one write after a quiet period.
+        """
+        if self._save_timer is not None:
+            self._save_timer.cancel()
+        self._save_timer = threading.Timer(
+            self.SAVE_DEBOUNCE_SECONDS, self._save_config
+        )
+        self._save_timer.daemon = True
+        self._save_timer.start()
+
+    def _notify_settings_change(self, delta: dict):
+        """Debounce on_settings_change, merging rapid deltas into one.
+
+        A model popup flick-through would otherwise fire one expensive
+        downstream reconfiguration per intermediate selection.
+        """
+        self._pending_settings.update(delta)
+        if self._settings_timer is not None:
+            self._settings_timer.cancel()
+        self._settings_timer = threading.Timer(
+            self.SETTINGS_DEBOUNCE_SECONDS, self._flush_settings
+        )
+        self._settings_timer.daemon = True
+        self._settings_timer.start()
+
+    def _flush_settings(self):
+        """Deliver the merged settings delta on the main thread."""
+        pending, self._pending_settings = self._pending_settings, {}
+        if not pending or not self.on_settings_change:
+            return
+        self._run_on_main_thread(lambda: self.on_settings_change(pending))
+
+    def _flush_save(self):
+        """Cancel any pending debounce and write immediately."""
+        if self._save_timer is not None:
+            self._save_timer.cancel()
+            self._save_timer = None
+            self._save_config()
+        # Quit must not race the background writer
+        if self._last_save is not None:
+            self._last_save.result()
 
     def _save_config(self):
-        """Save configuration to file."""
+        """Save configuration (snapshot now, write on the I/O worker)."""
+        snapshot = copy.deepcopy(self._config)
+        self._last_save = self._io_pool.submit(self._write_yaml, snapshot)
+
+    def _write_yaml(self, config):
+        """Write a config snapshot atomically (temp file + rename)."""
         try:
-            with open(self.config_path, 'w') as f:
-                yaml.dump(self._config, f, default_flow_style=False)
+            # Dump to one bytes buffer so the file is written with a
+            # single os.write instead of many small buffered writes
+            data = yaml.dump(
+                config, Dumper=_YamlDumper, default_flow_style=False
+            ).encode("utf-8")
+            tmp = self.config_path + ".tmp"
+            fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                os.write(fd, data)
+            finally:
+                os.close(fd)
+            os.replace(tmp, self.config_path)
+            # Refresh the cache under the new mtime so the next load
+            # doesn't have to re-parse what we just wrote
+            key = (self.config_path, os.stat(self.config_path).st_mtime_ns)
+            _CONFIG_CACHE.clear()
+            _CONFIG_CACHE[key] = copy.deepcopy(config)
         except Exception as e:
             print(f"Error saving config: {e}")
 
+    def _label(self, frame, text, font, color=None):
+        """Create a static borderless label (the common case here).
+
+        One helper instead of repeating the same seven PyObjC setter
+        calls per label block throughout window construction.
+        """
+        tf = NSTextField.alloc().initWithFrame_(frame)
+        tf.setStringValue_(text)
+        tf.setBezeled_(False)
+        tf.setDrawsBackground_(False)
+        tf.setEditable_(False)
+        tf.setSelectable_(False)
+        tf.setFont_(font)
+        if color is not None:
+            tf.setTextColor_(color)
+        return tf
+
     def _setup_window(self) -> None:
         """Set up the control panel window using AppKit."""
+        # Build everything inside one zero-duration, disabled-actions
+        # transaction so the ~60 addSubview_ calls below commit as a
+        # single layout pass instead of one CA transaction each
+        NSAnimationContext.beginGrouping()
+        NSAnimationContext.currentContext().setDuration_(0.0)
+        if HAS_CATRANSACTION:
+            CATransaction.begin()
+            CATransaction.setDisableActions_(True)
+        try:
+            self._build_window()
+        finally:
+            if HAS_CATRANSACTION:
+                CATransaction.commit()
+            NSAnimationContext.endGrouping()
+
+    def _build_window(self) -> None:
+        """Construct the window and all its subviews."""
         width = 380
         height = 750  # Increased height for history section
 
@@ -154,7 +491,7 @@ class ControlPanelWindow:
         # Configure window
         self._window.setTitle_("Dictation Controls")
         self._window.setReleasedWhenClosed_(False)
-        self._window.setMinSize_(NSMakeRect(0, 0, 350, 600).size)
+        self._window.setMinSize_(NSMakeSize(350, 600))
 
         # Create scroll view for content
         scroll_view = NSScrollView.alloc().initWithFrame_(NSMakeRect(0, 0, width, height))
@@ -165,34 +502,26 @@ class ControlPanelWindow:
 
         content_height = 1100  # Increased for history section
         content_view = NSView.alloc().initWithFrame_(NSMakeRect(0, 0, width, content_height))
+        # No per-add resize passes while subviews accumulate
+        content_view.setAutoresizesSubviews_(False)
 
         y_pos = content_height - 50
 
         # Title
-        title = NSTextField.alloc().initWithFrame_(
-            NSMakeRect(20, y_pos, width - 40, 30)
+        title = self._label(
+            NSMakeRect(20, y_pos, width - 40, 30), "Dictation App", _FONT_BOLD_18
         )
-        title.setStringValue_("Dictation App")
-        title.setBezeled_(False)
-        title.setDrawsBackground_(False)
-        title.setEditable_(False)
-        title.setSelectable_(False)
-        title.setFont_(NSFont.boldSystemFontOfSize_(18))
         content_view.addSubview_(title)
 
         y_pos -= 30
 
         # Status indicator
-        self._status_label = NSTextField.alloc().initWithFrame_(
-            NSMakeRect(20, y_pos, width - 40, 20)
-        )
-        self._status_label.setStringValue_("Status: Ready")
-        self._status_label.setBezeled_(False)
-        self._status_label.setDrawsBackground_(False)
-        self._status_label.setEditable_(False)
-        self._status_label.setSelectable_(False)
-        self._status_label.setFont_(NSFont.systemFontOfSize_(12))
-        self._status_label.setTextColor_(NSColor.secondaryLabelColor())
+        self._status_label = self._label(
+            NSMakeRect(20, y_pos, width - 40, 20),
+            "Status: Ready",
+            _FONT_12,
+            color=_COLOR_SECONDARY,
+        )
         content_view.addSubview_(self._status_label)
 
         y_pos -= 40
@@ -205,7 +534,7 @@ class ControlPanelWindow:
         self._record_button.setBezelStyle_(NSBezelStyleRounded)
         self._record_button.setTarget_(self)
         self._record_button.setAction_("toggleRecording:")
-        self._record_button.setFont_(NSFont.systemFontOfSize_(14))
+        self._record_button.setFont_(_FONT_14)
         content_view.addSubview_(self._record_button)
 
         y_pos -= 50
@@ -218,29 +547,17 @@ class ControlPanelWindow:
         y_pos -= 30
 
         # === SETTINGS SECTION ===
-        settings_title = NSTextField.alloc().initWithFrame_(
-            NSMakeRect(20, y_pos, width - 40, 20)
-        )
-        settings_title.setStringValue_("Settings")
-        settings_title.setBezeled_(False)
-        settings_title.setDrawsBackground_(False)
-        settings_title.setEditable_(False)
-        settings_title.setSelectable_(False)
-        settings_title.setFont_(NSFont.boldSystemFontOfSize_(14))
+        settings_title = self._label(
+            NSMakeRect(20, y_pos, width - 40, 20), "Settings", _FONT_BOLD_14
+        )
         content_view.addSubview_(settings_title)
 
         y_pos -= 35
 
         # Mode
-        mode_label = NSTextField.alloc().initWithFrame_(
-            NSMakeRect(20, y_pos, 100, 20)
-        )
-        mode_label.setStringValue_("Mode:")
-        mode_label.setBezeled_(False)
-        mode_label.setDrawsBackground_(False)
-        mode_label.setEditable_(False)
-        mode_label.setSelectable_(False)
-        mode_label.setFont_(NSFont.systemFontOfSize_(13))
+        mode_label = self._label(
+            NSMakeRect(20, y_pos, 100, 20), "Mode:", _FONT_13
+        )
         content_view.addSubview_(mode_label)
 
         self._mode_popup = NSPopUpButton.alloc().initWithFrame_(
@@ -263,15 +580,9 @@ class ControlPanelWindow:
         y_pos -= 35
 
         # Language
-        lang_label = NSTextField.alloc().initWithFrame_(
-            NSMakeRect(20, y_pos, 100, 20)
-        )
-        lang_label.setStringValue_("Language:")
-        lang_label.setBezeled_(False)
-        lang_label.setDrawsBackground_(False)
-        lang_label.setEditable_(False)
-        lang_label.setSelectable_(False)
-        lang_label.setFont_(NSFont.systemFontOfSize_(13))
+        lang_label = self._label(
+            NSMakeRect(20, y_pos, 100, 20), "Language:", _FONT_13
+        )
         content_view.addSubview_(lang_label)
 
         self._language_popup = NSPopUpButton.alloc().initWithFrame_(
@@ -287,15 +598,9 @@ class ControlPanelWindow:
         y_pos -= 35
 
         # Whisper Model
-        whisper_label = NSTextField.alloc().initWithFrame_(
-            NSMakeRect(20, y_pos, 100, 20)
-        )
-        whisper_label.setStringValue_("Whisper Model:")
-        whisper_label.setBezeled_(False)
-        whisper_label.setDrawsBackground_(False)
-        whisper_label.setEditable_(False)
-        whisper_label.setSelectable_(False)
-        whisper_label.setFont_(NSFont.systemFontOfSize_(13))
+        whisper_label = self._label(
+            NSMakeRect(20, y_pos, 100, 20), "Whisper Model:", _FONT_13
+        )
         content_view.addSubview_(whisper_label)
 
         self._whisper_model_popup = NSPopUpButton.alloc().initWithFrame_(
@@ -317,15 +622,9 @@ class ControlPanelWindow:
         y_pos -= 35
 
         # AI Model
-        ai_label = NSTextField.alloc().initWithFrame_(
-            NSMakeRect(20, y_pos, 100, 20)
-        )
-        ai_label.setStringValue_("AI Model:")
-        ai_label.setBezeled_(False)
-        ai_label.setDrawsBackground_(False)
-        ai_label.setEditable_(False)
-        ai_label.setSelectable_(False)
-        ai_label.setFont_(NSFont.systemFontOfSize_(13))
+        ai_label = self._label(
+            NSMakeRect(20, y_pos, 100, 20), "AI Model:", _FONT_13
+        )
         content_view.addSubview_(ai_label)
 
         self._ai_model_popup = NSPopUpButton.alloc().initWithFrame_(
@@ -357,29 +656,17 @@ class ControlPanelWindow:
         y_pos -= 30
 
         # === HOTKEYS SECTION ===
-        hotkey_title = NSTextField.alloc().initWithFrame_(
-            NSMakeRect(20, y_pos, width - 40, 20)
-        )
-        hotkey_title.setStringValue_("Hotkeys")
-        hotkey_title.setBezeled_(False)
-        hotkey_title.setDrawsBackground_(False)
-        hotkey_title.setEditable_(False)
-        hotkey_title.setSelectable_(False)
-        hotkey_title.setFont_(NSFont.boldSystemFontOfSize_(14))
+        hotkey_title = self._label(
+            NSMakeRect(20, y_pos, width - 40, 20), "Hotkeys", _FONT_BOLD_14
+        )
         content_view.addSubview_(hotkey_title)
 
         y_pos -= 35
 
         # Start Recording Hotkey
-        hotkey_label = NSTextField.alloc().initWithFrame_(
-            NSMakeRect(20, y_pos, 100, 20)
-        )
-        hotkey_label.setStringValue_("Start Key:")
-        hotkey_label.setBezeled_(False)
-        hotkey_label.setDrawsBackground_(False)
-        hotkey_label.setEditable_(False)
-        hotkey_label.setSelectable_(False)
-        hotkey_label.setFont_(NSFont.systemFontOfSize_(13))
+        hotkey_label = self._label(
+            NSMakeRect(20, y_pos, 100, 20), "Start Key:", _FONT_13
+        )
         content_view.addSubview_(hotkey_label)
 
         self._hotkey_field = NSTextField.alloc().initWithFrame_(
@@ -387,7 +674,7 @@ class ControlPanelWindow:
         )
         current_hotkey = self._config.get("behavior", {}).get("hotkey", "cmd+shift+space")
         self._hotkey_field.setStringValue_(current_hotkey)
-        self._hotkey_field.setFont_(NSFont.systemFontOfSize_(12))
+        self._hotkey_field.setFont_(_FONT_12)
         self._hotkey_field.setTarget_(self)
         self._hotkey_field.setAction_("hotkeyChanged:")
         content_view.addSubview_(self._hotkey_field)
@@ -395,15 +682,9 @@ class ControlPanelWindow:
         y_pos -= 35
 
         # Stop Recording Key
-        stop_label = NSTextField.alloc().initWithFrame_(
-            NSMakeRect(20, y_pos, 100, 20)
-        )
-        stop_label.setStringValue_("Stop Key:")
-        stop_label.setBezeled_(False)
-        stop_label.setDrawsBackground_(False)
-        stop_label.setEditable_(False)
-        stop_label.setSelectable_(False)
-        stop_label.setFont_(NSFont.systemFontOfSize_(13))
+        stop_label = self._label(
+            NSMakeRect(20, y_pos, 100, 20), "Stop Key:", _FONT_13
+        )
         content_view.addSubview_(stop_label)
 
         self._stop_key_field = NSTextField.alloc().initWithFrame_(
@@ -411,7 +692,7 @@ class ControlPanelWindow:
         )
         current_stop = self._config.get("behavior", {}).get("stop_key", "enter")
         self._stop_key_field.setStringValue_(current_stop)
-        self._stop_key_field.setFont_(NSFont.systemFontOfSize_(12))
+        self._stop_key_field.setFont_(_FONT_12)
         self._stop_key_field.setTarget_(self)
         self._stop_key_field.setAction_("stopKeyChanged:")
         content_view.addSubview_(self._stop_key_field)
@@ -419,16 +700,12 @@ class ControlPanelWindow:
         y_pos -= 30
 
         # Note about restart
-        restart_note = NSTextField.alloc().initWithFrame_(
-            NSMakeRect(20, y_pos, width - 40, 30)
+        restart_note = self._label(
+            NSMakeRect(20, y_pos, width - 40, 30),
+            "Note: Restart app for hotkey changes to take effect",
+            _FONT_10,
+            color=_COLOR_SECONDARY,
         )
-        restart_note.setStringValue_("Note: Restart app for hotkey changes to take effect")
-        restart_note.setBezeled_(False)
-        restart_note.setDrawsBackground_(False)
-        restart_note.setEditable_(False)
-        restart_note.setSelectable_(False)
-        restart_note.setFont_(NSFont.systemFontOfSize_(10))
-        restart_note.setTextColor_(NSColor.secondaryLabelColor())
         content_view.addSubview_(restart_note)
 
         y_pos -= 40
@@ -441,29 +718,19 @@ class ControlPanelWindow:
         y_pos -= 30
 
         # === CONTEXT SECTION ===
-        context_title = NSTextField.alloc().initWithFrame_(
-            NSMakeRect(20, y_pos, width - 40, 20)
-        )
-        context_title.setStringValue_("Context (for drafting mode)")
-        context_title.setBezeled_(False)
-        context_title.setDrawsBackground_(False)
-        context_title.setEditable_(False)
-        context_title.setSelectable_(False)
-        context_title.setFont_(NSFont.boldSystemFontOfSize_(14))
+        context_title = self._label(
+            NSMakeRect(20, y_pos, width - 40, 20), "Context (for drafting mode)", _FONT_BOLD_14
+        )
         content_view.addSubview_(context_title)
 
         y_pos -= 25
 
-        self._context_label = NSTextField.alloc().initWithFrame_(
-            NSMakeRect(20, y_pos, width - 40, 18)
+        self._context_label = self._label(
+            NSMakeRect(20, y_pos, width - 40, 18),
+            "No context set",
+            _FONT_11,
+            color=_COLOR_SECONDARY,
         )
-        self._context_label.setStringValue_("No context set")
-        self._context_label.setBezeled_(False)
-        self._context_label.setDrawsBackground_(False)
-        self._context_label.setEditable_(False)
-        self._context_label.setSelectable_(False)
-        self._context_label.setFont_(NSFont.systemFontOfSize_(11))
-        self._context_label.setTextColor_(NSColor.secondaryLabelColor())
         content_view.addSubview_(self._context_label)
 
         y_pos -= 35
@@ -516,15 +783,9 @@ class ControlPanelWindow:
         y_pos -= 30
 
         # === CLIPBOARD HISTORY SECTION ===
-        history_title = NSTextField.alloc().initWithFrame_(
-            NSMakeRect(20, y_pos, width - 40, 20)
-        )
-        history_title.setStringValue_("Clipboard History")
-        history_title.setBezeled_(False)
-        history_title.setDrawsBackground_(False)
-        history_title.setEditable_(False)
-        history_title.setSelectable_(False)
-        history_title.setFont_(NSFont.boldSystemFontOfSize_(14))
+        history_title = self._label(
+            NSMakeRect(20, y_pos, width - 40, 20), "Clipboard History", _FONT_BOLD_14
+        )
         content_view.addSubview_(history_title)
 
         y_pos -= 30
@@ -558,31 +819,76 @@ class ControlPanelWindow:
         history_scroll.setHasHorizontalScroller_(False)
         history_scroll.setAutohidesScrollers_(True)
         history_scroll.setBorderType_(1)  # NSLineBorder
+        # One CA layer tree for the list; row draws batch into it
+        history_scroll.setWantsLayer_(True)
 
-        # Container view for history items
-        self._history_container = NSView.alloc().initWithFrame_(
-            NSMakeRect(0, 0, width - 60, 280)
-        )
-        self._history_container.setWantsLayer_(True)
-
-        history_scroll.setDocumentView_(self._history_container)
+        # The table itself is built lazily on first show(); until then
+        # the scroll view is an empty placeholder and no history is read
+        self._history_scroll = history_scroll
         content_view.addSubview_(history_scroll)
 
-        # Load initial history
-        self._populate_history()
-
+        content_view.setAutoresizesSubviews_(True)
         scroll_view.setDocumentView_(content_view)
         self._window.setContentView_(scroll_view)
 
+    def _build_history_section(self) -> None:
+        """Build the history table on first show.
+
+        Cold start skips both the view-based table construction and the
+        history file walk when the panel is never opened.
+        """
+        if self._history_built or not self._history_scroll:
+            return
+        self._history_built = True
+        if HAS_HISTORY and self._history is None:
+            self._history = get_history()
+
+        width = self._history_scroll.frame().size.width
+
+        # View-based table for history items; rows are reused as the
+        # list scrolls, so refreshes don't reallocate subview trees
+        self._history_table = NSTableView.alloc().initWithFrame_(
+            NSMakeRect(0, 0, width, 280)
+        )
+        column = NSTableColumn.alloc().initWithIdentifier_("history")
+        column.setWidth_(width)
+        self._history_table.addTableColumn_(column)
+        self._history_table.setHeaderView_(None)
+        self._history_table.setRowHeight_(55)
+        # Flatten cell subviews into the row's layer so each row
+        # composites as a single opaque surface
+        self._history_table.setCanDrawSubviewsIntoLayer_(True)
+
+        self._history_datasource = _HistoryDataSource.alloc().init()
+        self._history_datasource.panel = self
+        self._history_table.setDataSource_(self._history_datasource)
+        self._history_table.setDelegate_(self._history_datasource)
+
+        self._history_scroll.setDocumentView_(self._history_table)
+
     def show(self) -> None:
         """Show the control panel window."""
         print("Control panel show() called")
-        if not HAS_APPKIT or not self._window:
+        if not HAS_APPKIT:
             print("AppKit not available, cannot show control panel")
             return
 
         def _show():
             print("Showing control panel window...")
+            if self._window is None:
+                # First show: build the window now (this is also what
+                # pulls the config in, via the settings fields reading
+                # self._config), then apply any state/context updates
+                # that arrived before the views existed
+                self._setup_window()
+                self._pending_ui.setdefault("state", (self._state, None))
+                self._pending_ui.setdefault("context", self._has_context)
+                self._flush_ui()
+            if not self._history_built:
+                self._build_history_section()
+            if self._history_dirty:
+                self._history_dirty = False
+                self._populate_history()
             self._window.setLevel_(3)  # NSFloatingWindowLevel
             self._window.makeKeyAndOrderFront_(None)
             self._window.center()
@@ -602,50 +908,58 @@ class ControlPanelWindow:
         self._run_on_main_thread(_hide)
 
     def set_state(self, state: str, language: Optional[str] = None) -> None:
-        """Update the displayed state."""
+        """Update the displayed state (coalesced; latest wins)."""
         self._state = state
-
-        def _update():
-            if not self._status_label or not self._record_button:
-                return
-
-            if state == "idle":
-                self._status_label.setStringValue_("Status: Ready")
-                self._record_button.setTitle_("Start Recording")
-                self._record_button.setEnabled_(True)
-            elif state == "recording":
-                self._status_label.setStringValue_("Status: Recording...")
-                self._record_button.setTitle_("Stop Recording")
-                self._record_button.setEnabled_(True)
-            elif state == "processing":
-                self._status_label.setStringValue_("Status: Processing...")
-                self._record_button.setTitle_("Processing...")
-                self._record_button.setEnabled_(False)
-            elif state == "done":
-                lang_str = f" ({language})" if language else ""
-                self._status_label.setStringValue_(f"Status: Done{lang_str}")
-                self._record_button.setTitle_("Start Recording")
-                self._record_button.setEnabled_(True)
-            elif state == "error":
-                self._status_label.setStringValue_("Status: Error")
-                self._record_button.setTitle_("Start Recording")
-                self._record_button.setEnabled_(True)
-
-        self._run_on_main_thread(_update)
+        self._pending_ui["state"] = (state, language)
+        self._schedule_ui_flush()
 
     def update_context_status(self, has_context: bool) -> None:
-        """Update the context status indicator."""
+        """Update the context status indicator (coalesced)."""
         self._has_context = has_context
+        self._pending_ui["context"] = has_context
+        self._schedule_ui_flush()
 
-        def _update():
-            if self._context_label:
-                if has_context:
+    def _schedule_ui_flush(self) -> None:
+        """Schedule one main-thread flush for pending UI updates.
+
+        A burst like idle -> recording -> processing makes one run-loop
+        trip that applies only the latest values, instead of one
+        callAfter per call.
+        """
+        if self._ui_flush_scheduled:
+            return
+        self._ui_flush_scheduled = True
+        self._run_on_main_thread(self._flush_ui)
+
+    def _flush_ui(self) -> None:
+        """Apply whatever state/context updates are pending."""
+        self._ui_flush_scheduled = False
+        pending, self._pending_ui = self._pending_ui, {}
+
+        if "state" in pending and pending["state"] != self._applied_state:
+            state, language = pending["state"]
+            # Local bindings: one attribute load each instead of one
+            # per setter under rapid start/stop state bursts
+            label = self._status_label
+            button = self._record_button
+            entry = self._STATE_TABLE.get(state)
+            if label and button and entry is not None:
+                self._applied_state = pending["state"]
+                status, title, enabled = entry
+                if state == "done" and language:
+                    status = f"{status} ({language})"
+                label.setStringValue_(status)
+                button.setTitle_(title)
+                button.setEnabled_(enabled)
+
+        if "context" in pending and self._context_label:
+            if pending["context"] != self._applied_context:
+                self._applied_context = pending["context"]
+                if pending["context"]:
                     self._context_label.setStringValue_("Context: Set")
                 else:
                     self._context_label.setStringValue_("No context set")
 
-        self._run_on_main_thread(_update)
-
     def toggleRecording_(self, sender) -> None:
         """Handle record button click."""
         if self.on_toggle_recording:
@@ -661,7 +975,7 @@ class ControlPanelWindow:
         if "generation" not in self._config:
             self._config["generation"] = {}
         self._config["generation"]["enabled"] = drafting
-        self._save_config()
+        self._schedule_save()
 
         if self.on_mode_change:
             self.on_mode_change(drafting)
@@ -676,7 +990,7 @@ class ControlPanelWindow:
         if "model" not in self._config:
             self._config["model"] = {}
         self._config["model"]["language"] = lang
-        self._save_config()
+        self._schedule_save()
 
         if self.on_language_change:
             self.on_language_change(lang)
@@ -689,10 +1003,9 @@ class ControlPanelWindow:
         if "model" not in self._config:
             self._config["model"] = {}
         self._config["model"]["name"] = model
-        self._save_config()
+        self._schedule_save()
 
-        if self.on_settings_change:
-            self.on_settings_change({"whisper_model": model})
+        self._notify_settings_change({"whisper_model": model})
 
     def aiModelChanged_(self, sender) -> None:
         """Handle AI model change."""
@@ -702,36 +1015,43 @@ class ControlPanelWindow:
         if "generation" not in self._config:
             self._config["generation"] = {}
         self._config["generation"]["model"] = model
-        self._save_config()
+        self._schedule_save()
 
-        if self.on_settings_change:
-            self.on_settings_change({"ai_model": model})
+        self._notify_settings_change({"ai_model": model})
 
     def hotkeyChanged_(self, sender) -> None:
         """Handle hotkey change."""
         hotkey = str(self._hotkey_field.stringValue())
 
+        if not _HOTKEY_RE.match(hotkey):
+            self._hotkey_field.setTextColor_(NSColor.systemRedColor())
+            return
+        self._hotkey_field.setTextColor_(NSColor.textColor())
+
         # Save to config
         if "behavior" not in self._config:
             self._config["behavior"] = {}
         self._config["behavior"]["hotkey"] = hotkey
-        self._save_config()
+        self._schedule_save()
 
-        if self.on_settings_change:
-            self.on_settings_change({"hotkey": hotkey})
+        self._notify_settings_change({"hotkey": hotkey})
 
     def stopKeyChanged_(self, sender) -> None:
         """Handle stop key change."""
         stop_key = str(self._stop_key_field.stringValue())
 
+        if not _HOTKEY_RE.match(stop_key):
+            self._stop_key_field.setTextColor_(NSColor.systemRedColor())
+            return
+        self._stop_key_field.setTextColor_(NSColor.textColor())
+
         # Save to config
         if "behavior" not in self._config:
             self._config["behavior"] = {}
         self._config["behavior"]["stop_key"] = stop_key
-        self._save_config()
+        self._schedule_save()
 
-        if self.on_settings_change:
-            self.on_settings_change({"stop_key": stop_key})
+        self._notify_settings_change({"stop_key": stop_key})
 
     def setContext_(self, sender) -> None:
         """Handle set context button click."""
@@ -746,194 +1066,176 @@ class ControlPanelWindow:
 
     def quitApp_(self, sender) -> None:
         """Handle quit button click."""
+        self._flush_save()
         if self.on_quit:
             self.on_quit()
 
     def refreshHistory_(self, sender) -> None:
         """Handle refresh history button click."""
+        self._history_dirty = False
         self._populate_history()
 
+    def notify_history_changed(self) -> None:
+        """Mark the history list stale; the next show() re-reads it.
+
+        Lets the dictation pipeline flag new entries without forcing a
+        refresh while the panel is hidden (or polling while visible).
+        """
+        self._history_dirty = True
+
     def clearHistory_(self, sender) -> None:
         """Handle clear history button click."""
-        if HAS_HISTORY:
-            history = get_history()
-            history.clear()
+        if self._history is not None:
+            self._history.clear()
             self._populate_history()
 
     def _populate_history(self) -> None:
-        """Populate the history list with entries."""
-        if not HAS_APPKIT or not self._history_container:
+        """Refresh the history table, updating only the changed rows.
+
+        The common refresh is one or two new dictations prepended to an
+        otherwise unchanged list, so matching rows diff against the
+        previous snapshot and only the head insertions (plus any rows
+        evicted off the bottom) are issued to the table; everything
+        else falls back to a full reloadData().
+        """
+        if not HAS_APPKIT or not self._history_table:
             return
 
-        def _update():
-            # Clear existing buttons
-            for btn in self._history_buttons:
-                btn.removeFromSuperview()
-            self._history_buttons.clear()
-
-            if not HAS_HISTORY:
-                # Show message that history is not available
-                no_history_label = NSTextField.alloc().initWithFrame_(
-                    NSMakeRect(10, 240, 300, 30)
-                )
-                no_history_label.setStringValue_("History module not available")
-                no_history_label.setBezeled_(False)
-                no_history_label.setDrawsBackground_(False)
-                no_history_label.setEditable_(False)
-                no_history_label.setSelectable_(False)
-                no_history_label.setTextColor_(NSColor.secondaryLabelColor())
-                self._history_container.addSubview_(no_history_label)
-                return
+        history = self._history
+        entries = history.get_recent(20) if history is not None else []
 
-            history = get_history()
-            entries = history.get_recent(20)  # Show last 20 entries
+        def _update():
+            table = self._history_table
+            old_keys = self._history_keys
+            new_keys = [(e.timestamp, e.text) for e in entries]
+            self._history_entries = entries
+            self._history_keys = new_keys
 
-            if not entries:
-                # Show message that history is empty
-                empty_label = NSTextField.alloc().initWithFrame_(
-                    NSMakeRect(10, 240, 300, 30)
-                )
-                empty_label.setStringValue_("No history yet - dictate something!")
-                empty_label.setBezeled_(False)
-                empty_label.setDrawsBackground_(False)
-                empty_label.setEditable_(False)
-                empty_label.setSelectable_(False)
-                empty_label.setTextColor_(NSColor.secondaryLabelColor())
-                self._history_container.addSubview_(empty_label)
-                self._history_buttons.append(empty_label)
+            if new_keys == old_keys:
                 return
 
-            # Calculate container height based on number of entries
-            item_height = 60
-            container_height = max(280, len(entries) * item_height + 10)
-            container_width = self._history_container.frame().size.width
-
-            self._history_container.setFrameSize_(
-                NSMakeRect(0, 0, container_width, container_height).size
-            )
-
-            y_pos = container_height - item_height
-
-            for idx, entry in enumerate(entries):
-                # Format timestamp
-                try:
-                    dt = datetime.fromisoformat(entry.timestamp)
-                    time_str = dt.strftime("%m/%d %H:%M")
-                except (ValueError, AttributeError):
-                    time_str = "Unknown"
-
-                # Truncate text for display
-                display_text = entry.text[:80]
-                if len(entry.text) > 80:
-                    display_text += "..."
-
-                # Mode indicator
-                mode_indicator = "✨" if entry.mode == "drafting" else "📝"
-
-                # Create container for this entry
-                entry_view = NSView.alloc().initWithFrame_(
-                    NSMakeRect(5, y_pos, container_width - 10, item_height - 5)
-                )
+            # Transitions to/from the placeholder row, and any change
+            # that isn't a pure head-prepend, take the full reload
+            if not old_keys or not new_keys:
+                table.reloadData()
+                return
+            try:
+                n_new = new_keys.index(old_keys[0])
+            except ValueError:
+                table.reloadData()
+                return
+            if new_keys[n_new:] != old_keys[: len(new_keys) - n_new]:
+                table.reloadData()
+                return
 
-                # Text label
-                text_label = NSTextField.alloc().initWithFrame_(
-                    NSMakeRect(5, 22, container_width - 80, 30)
+            n_evicted = len(old_keys) + n_new - len(new_keys)
+            table.beginUpdates()
+            if n_new:
+                table.insertRowsAtIndexes_withAnimation_(
+                    NSIndexSet.indexSetWithIndexesInRange_(
+                        NSMakeRange(0, n_new)
+                    ),
+                    0,
                 )
-                text_label.setStringValue_(f"{mode_indicator} {display_text}")
-                text_label.setBezeled_(False)
-                text_label.setDrawsBackground_(False)
-                text_label.setEditable_(False)
-                text_label.setSelectable_(True)
-                text_label.setFont_(NSFont.systemFontOfSize_(11))
-                text_label.setLineBreakMode_(4)  # NSLineBreakByTruncatingTail
-                entry_view.addSubview_(text_label)
-
-                # Time and language label
-                lang_str = f" ({entry.language})" if entry.language else ""
-                meta_label = NSTextField.alloc().initWithFrame_(
-                    NSMakeRect(5, 5, container_width - 80, 18)
+            if n_evicted > 0:
+                table.removeRowsAtIndexes_withAnimation_(
+                    NSIndexSet.indexSetWithIndexesInRange_(
+                        NSMakeRange(len(old_keys) - n_evicted, n_evicted)
+                    ),
+                    0,
                 )
-                meta_label.setStringValue_(f"{time_str}{lang_str}")
-                meta_label.setBezeled_(False)
-                meta_label.setDrawsBackground_(False)
-                meta_label.setEditable_(False)
-                meta_label.setSelectable_(False)
-                meta_label.setFont_(NSFont.systemFontOfSize_(10))
-                meta_label.setTextColor_(NSColor.secondaryLabelColor())
-                entry_view.addSubview_(meta_label)
-
-                # Copy button
-                copy_btn = NSButton.alloc().initWithFrame_(
-                    NSMakeRect(container_width - 70, 15, 60, 25)
-                )
-                copy_btn.setTitle_("Copy")
-                copy_btn.setBezelStyle_(NSBezelStyleRounded)
-                copy_btn.setFont_(NSFont.systemFontOfSize_(11))
-                copy_btn.setTag_(idx)
-                copy_btn.setTarget_(self)
-                copy_btn.setAction_("copyHistoryItem:")
-                entry_view.addSubview_(copy_btn)
-
-                self._history_container.addSubview_(entry_view)
-                self._history_buttons.append(entry_view)
-
-                y_pos -= item_height
+            table.endUpdates()
 
         self._run_on_main_thread(_update)
 
     def copyHistoryItem_(self, sender) -> None:
         """Handle copy button click for a history item."""
-        index = sender.tag()
-
-        if not HAS_HISTORY:
+        if self._history is None or not self._history_table:
             return
 
-        history = get_history()
-        entry = history.get_by_index(index)
+        index = self._history_table.rowForView_(sender)
+        if index < 0 or index >= len(self._history_entries):
+            return
+        entry = self._history_entries[index]
 
         if entry:
-            # Copy to clipboard
-            if HAS_PYPERCLIP:
-                try:
-                    pyperclip.copy(entry.text)
-                    print(f"Copied history item {index} to clipboard")
-                    # Update button text temporarily
-                    self._show_copy_feedback(sender)
-                except Exception as e:
-                    print(f"Error copying to clipboard: {e}")
-            else:
-                # Fallback to pbcopy on macOS
-                import subprocess
-                try:
-                    process = subprocess.Popen(
-                        ['pbcopy'],
-                        stdin=subprocess.PIPE,
-                        env={'LANG': 'en_US.UTF-8'}
-                    )
-                    process.communicate(entry.text.encode('utf-8'))
-                    print(f"Copied history item {index} to clipboard (via pbcopy)")
-                    self._show_copy_feedback(sender)
-                except Exception as e:
-                    print(f"Error copying to clipboard: {e}")
+            # The clipboard write (a ~50ms pbcopy spawn on the fallback
+            # path) runs off the AppKit action thread; feedback is
+            # scheduled back to the main thread when it lands
+            threading.Thread(
+                target=self._do_copy, args=(entry, index, sender), daemon=True
+            ).start()
+
+    def _do_copy(self, entry, index: int, sender) -> None:
+        """Write an entry's text to the clipboard on a worker thread."""
+        text = entry.text
+        if HAS_APPKIT:
+            # In-process NSPasteboard call: no fork/exec, ~2 orders of
+            # magnitude faster than spawning pbcopy per copy
+            try:
+                pb = NSPasteboard.generalPasteboard()
+                pb.clearContents()
+                pb.setString_forType_(text, NSPasteboardTypeString)
+                print(f"Copied history item {index} to clipboard")
+                self._show_copy_feedback(sender)
+                return
+            except Exception as e:
+                print(f"Error copying via NSPasteboard: {e}")
+
+        if HAS_PYPERCLIP:
+            try:
+                pyperclip.copy(text)
+                print(f"Copied history item {index} to clipboard")
+                self._show_copy_feedback(sender)
+            except Exception as e:
+                print(f"Error copying to clipboard: {e}")
+        else:
+            # Fallback to pbcopy on macOS
+            try:
+                # Encoded bytes are cached on the entry; repeat copies
+                # of a long entry skip the O(len) re-encode
+                data = getattr(entry, "_utf8", None)
+                if data is None:
+                    data = text.encode('utf-8')
+                    entry._utf8 = data
+                process = subprocess.Popen(
+                    ['pbcopy'],
+                    stdin=subprocess.PIPE,
+                    env={'LANG': 'en_US.UTF-8'}
+                )
+                process.communicate(data)
+                print(f"Copied history item {index} to clipboard (via pbcopy)")
+                self._show_copy_feedback(sender)
+            except Exception as e:
+                print(f"Error copying to clipboard: {e}")
 
     def _show_copy_feedback(self, button) -> None:
         """Show temporary feedback after copying."""
-        def _update():
-            original_title = button.title()
-            button.setTitle_("Copied!")
-            button.setEnabled_(False)
+        self._run_on_main_thread(lambda: self._begin_copy_feedback(button))
 
-            def _restore():
-                import time
-                time.sleep(1.0)
-                def _do_restore():
-                    button.setTitle_(original_title)
-                    button.setEnabled_(True)
-                self._run_on_main_thread(_do_restore)
+    def _begin_copy_feedback(self, button) -> None:
+        """Swap the button title and schedule its restore (main thread)."""
+        original_title = button.title()
+        button.setTitle_("Copied!")
+        button.setEnabled_(False)
 
-            threading.Thread(target=_restore, daemon=True).start()
+        restore = lambda: self._finish_copy_feedback(button, original_title)
+        # Run-loop timer on the main thread; no daemon thread parked
+        # in sleep() per click and no cross-thread hop back
+        try:
+            from PyObjCTools import AppHelper
+            AppHelper.callLater(1.0, restore)
+        except Exception:
+            timer = threading.Timer(
+                1.0, lambda: self._run_on_main_thread(restore)
+            )
+            timer.daemon = True
+            timer.start()
 
-        self._run_on_main_thread(_update)
+    def _finish_copy_feedback(self, button, original_title) -> None:
+        """Restore a copy button after the feedback interval."""
+        button.setTitle_(original_title)
+        button.setEnabled_(True)
 
     def _run_on_main_thread(self, func) -> None:
         """Run a function on the main thread."""
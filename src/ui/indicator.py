@@ -1,7 +1,9 @@
 """Floating status indicator window."""
 
+import functools
+import sys
 import threading
-import time
+from collections import namedtuple
 from typing import Optional
 
 try:
@@ -19,13 +21,50 @@ try:
         NSTextAlignmentCenter,
         NSScreen,
         NSAnimationContext,
+        NSApplicationDidChangeScreenParametersNotification,
+    )
+    from Foundation import (
+        NSNotificationCenter,
+        NSObject,
+        NSOperationQueue,
+        NSThread,
+        NSTimer,
     )
-    from Foundation import NSObject
 
     HAS_APPKIT = True
+    # Resolved once at import: addOperationWithBlock_ on the main
+    # queue enqueues without the signal-based run-loop wakeup that
+    # AppHelper.callAfter performs per call
+    _MAIN_QUEUE = NSOperationQueue.mainQueue()
+
+    class _TimerTarget(NSObject):
+        """Forwards an NSTimer fire to a stored Python callable."""
+
+        def fire_(self, timer):
+            callback = getattr(self, "callback", None)
+            if callback is not None:
+                callback()
 except ImportError:
     HAS_APPKIT = False
 
+try:
+    from Quartz import CABasicAnimation, CATransaction, CGColorCreateGenericRGB
+
+    HAS_QUARTZ = True
+except ImportError:
+    HAS_QUARTZ = False
+
+
+# Computed window origin, shared across window (re)builds; cleared by
+# the screen-parameters observer installed in _setup_window
+_WINDOW_RECT_CACHE = None
+_SCREEN_OBSERVER_INSTALLED = False
+
+
+# Pre-resolved per-state display config: one dict lookup plus attribute
+# access on the hot path instead of nested-dict subscriptions
+StateConfig = namedtuple("StateConfig", "text bg_ns text_ns bg_cg")
+
 
 class FloatingIndicator:
     """Floating status indicator that shows recording state."""
@@ -64,25 +103,92 @@ class FloatingIndicator:
         self._window = None
         self._text_field = None
         self._visible = False
-        self._auto_hide_timer: Optional[threading.Timer] = None
-
-        if HAS_APPKIT and enabled:
-            self._setup_window()
+        self._current_state: Optional[str] = None
+        # Last values pushed into the views; identical sets are skipped
+        # before they can trigger AppKit invalidation
+        self._last_text = ""
+        self._last_bg = None
+        self._last_fg = None
+        # Latest-wins slot for update() bursts; only the transition
+        # from empty to full schedules a main-thread hop. The lock makes
+        # the observe-then-store pairs atomic: without it a writer can
+        # see the old value while the drain is mid-clear and skip the
+        # schedule, losing the newest state
+        self._pending_state: Optional[str] = None
+        self._pending_lock = threading.Lock()
+        # Generation counter guards against delayed hides whose timer
+        # fired before a newer show() could invalidate it
+        self._hide_generation = 0
+        # Flat per-state configs with pre-built NSColors; resolved once
+        # after window setup so state changes are a dict lookup plus
+        # attribute reads, with no bridged allocations
+        self._state_table = {}
+        # ObjC setters bound once at window build; the proxy attribute
+        # resolution (two LOAD_ATTRs plus selector lookup) happens there
+        # instead of on every call in the update hot path
+        self._tf_set_string = None
+        self._tf_set_color = None
+        self._win_set_bg = None
+        self._layer_set_bg = None
+
+    def _ensure_window(self) -> None:
+        """Build the window on first use (main thread only).
+
+        Construction is deferred out of __init__ so app cold-start never
+        pays for the NSWindow/NSTextField bridging when the user has not
+        dictated yet (or the indicator is disabled).
+        """
+        if self._window is not None:
+            return
+        self._setup_window()
+        self._state_table = {
+            name: StateConfig(
+                cfg["text"],
+                NSColor.colorWithRed_green_blue_alpha_(*cfg["bg_color"]),
+                NSColor.colorWithRed_green_blue_alpha_(*cfg["text_color"]),
+                CGColorCreateGenericRGB(*cfg["bg_color"])
+                if HAS_QUARTZ
+                else None,
+            )
+            for name, cfg in self.STATES.items()
+        }
 
     def _setup_window(self) -> None:
         """Set up the floating window using AppKit."""
+        global _WINDOW_RECT_CACHE, _SCREEN_OBSERVER_INSTALLED
+
         # Window dimensions
         width = 180
         height = 50
 
-        # Get screen dimensions and position window at top center
-        screen = NSScreen.mainScreen()
-        if screen:
-            screen_frame = screen.frame()
-            x = (screen_frame.size.width - width) / 2
-            y = screen_frame.size.height - height - 100  # 100px from top
-        else:
-            x, y = 500, 800
+        # Memoized top-center origin: the screen-frame query and float
+        # math run once per screen layout, not per window build. A
+        # display reconfiguration clears the cache
+        if _WINDOW_RECT_CACHE is None:
+            screen = NSScreen.mainScreen()
+            if screen:
+                screen_frame = screen.frame()
+                x = (screen_frame.size.width - width) / 2
+                y = screen_frame.size.height - height - 100  # 100px from top
+            else:
+                x, y = 500, 800
+            _WINDOW_RECT_CACHE = (x, y)
+
+        if not _SCREEN_OBSERVER_INSTALLED:
+            _SCREEN_OBSERVER_INSTALLED = True
+
+            def _on_screen_change(note):
+                global _WINDOW_RECT_CACHE
+                _WINDOW_RECT_CACHE = None
+
+            NSNotificationCenter.defaultCenter().addObserverForName_object_queue_usingBlock_(
+                NSApplicationDidChangeScreenParametersNotification,
+                None,
+                None,
+                _on_screen_change,
+            )
+
+        x, y = _WINDOW_RECT_CACHE
 
         # Create window
         rect = NSMakeRect(x, y, width, height)
@@ -103,12 +209,16 @@ class FloatingIndicator:
 
         # Create content view with rounded corners
         content_view = NSView.alloc().initWithFrame_(NSMakeRect(0, 0, width, height))
+        # Layer-backed so fades run as Core Animation opacity on the
+        # window server instead of AppKit's CPU-driven animator
+        content_view.setWantsLayer_(True)
 
         # Create text field
         self._text_field = NSTextField.alloc().initWithFrame_(
             NSMakeRect(10, 10, width - 20, height - 20)
         )
         self._text_field.setStringValue_("Ready")
+        self._last_text = "Ready"
         self._text_field.setBezeled_(False)
         self._text_field.setDrawsBackground_(False)
         self._text_field.setEditable_(False)
@@ -120,6 +230,86 @@ class FloatingIndicator:
         content_view.addSubview_(self._text_field)
         self._window.setContentView_(content_view)
 
+        self._tf_set_string = self._text_field.setStringValue_
+        self._tf_set_color = self._text_field.setTextColor_
+        self._win_set_bg = self._window.setBackgroundColor_
+        self._layer_set_bg = content_view.layer().setBackgroundColor_
+
+    def _fade(self, from_value: float, to_value: float, completion=None) -> None:
+        """Fade the content view's backing layer (main thread only).
+
+        The CABasicAnimation composites on the window server, so the
+        fade costs no animator proxy allocation and no AppKit animation
+        timer on the main thread. Falls back to the window animator
+        when Quartz is unavailable.
+
+        Args:
+            from_value: Starting opacity
+            to_value: Final opacity
+            completion: Optional callable run when the fade finishes
+        """
+        layer = self._window.contentView().layer()
+        if HAS_QUARTZ and layer is not None:
+            CATransaction.begin()
+            if completion is not None:
+                CATransaction.setCompletionBlock_(completion)
+            anim = CABasicAnimation.animationWithKeyPath_("opacity")
+            anim.setFromValue_(from_value)
+            anim.setToValue_(to_value)
+            anim.setDuration_(0.2)
+            layer.addAnimation_forKey_(anim, "fade")
+            layer.setOpacity_(to_value)
+            CATransaction.commit()
+        else:
+            self._window.setAlphaValue_(from_value)
+
+            def _animate(context):
+                context.setDuration_(0.2)
+                self._window.animator().setAlphaValue_(to_value)
+
+            NSAnimationContext.runAnimationGroup_completionHandler_(
+                _animate, completion
+            )
+
+    def _set_field_text(self, value: str) -> None:
+        """Set the label text, skipping AppKit when unchanged."""
+        if value != self._last_text:
+            self._last_text = value
+            self._tf_set_string(value)
+
+    def _set_colors(self, bg, fg=None, bg_cg=None) -> None:
+        """Apply cached colors; identity checks make repeats free."""
+        if bg is not self._last_bg:
+            self._last_bg = bg
+            if bg_cg is not None:
+                # Pre-built CGColor set straight on the backing layer:
+                # no NSColor resolution between here and the window
+                # server
+                self._layer_set_bg(bg_cg)
+            else:
+                self._win_set_bg(bg)
+        if fg is not None and fg is not self._last_fg:
+            self._last_fg = fg
+            self._tf_set_color(fg)
+
+    def _apply_state(self, state: str) -> None:
+        """Resolve a state and push its text/colors (main thread only).
+
+        Single shared site for the show/update/transition hot paths;
+        the _set_field_text/_set_colors guards keep repeated applies
+        free of AppKit calls.
+
+        Args:
+            state: One of 'listening', 'processing', 'done', 'error'
+        """
+        key = state if state in self._state_table else "listening"
+        if key == self._current_state:
+            return
+        self._current_state = key
+        config = self._state_table[key]
+        self._set_field_text(config.text)
+        self._set_colors(config.bg_ns, config.text_ns, config.bg_cg)
+
     def show(self, state: str = "listening") -> None:
         """Show the indicator with given state.
 
@@ -130,39 +320,19 @@ class FloatingIndicator:
             return
 
         # Cancel any pending auto-hide
-        if self._auto_hide_timer:
-            self._auto_hide_timer.cancel()
-            self._auto_hide_timer = None
+        self._cancel_auto_hide()
 
         def _show():
-            if self._window is None:
-                return
-
-            config = self.STATES.get(state, self.STATES["listening"])
-
-            # Update text
-            self._text_field.setStringValue_(config["text"])
-
-            # Update colors
-            r, g, b, a = config["bg_color"]
-            bg_color = NSColor.colorWithRed_green_blue_alpha_(r, g, b, a)
-
-            r, g, b, a = config["text_color"]
-            text_color = NSColor.colorWithRed_green_blue_alpha_(r, g, b, a)
+            self._ensure_window()
 
-            self._window.setBackgroundColor_(bg_color)
-            self._text_field.setTextColor_(text_color)
-
-            # Show window with fade-in
-            self._window.setAlphaValue_(0.0)
-            self._window.orderFrontRegardless()
-            self._visible = True
-
-            # Animate fade-in
-            NSAnimationContext.beginGrouping()
-            NSAnimationContext.currentContext().setDuration_(0.2)
-            self._window.animator().setAlphaValue_(1.0)
-            NSAnimationContext.endGrouping()
+            # Already visible: just swap the state in place. The fade
+            # and orderFront only run on the hidden-to-visible edge, so
+            # show -> update -> show sequences never re-fade or flicker
+            self._apply_state(state)
+            if not self._visible:
+                self._window.orderFrontRegardless()
+                self._fade(0.0, 1.0)
+                self._visible = True
 
         # Run on main thread
         self._run_on_main_thread(_show)
@@ -177,18 +347,71 @@ class FloatingIndicator:
             self.show(state)
             return
 
-        def _update():
-            if self._window is None or self._text_field is None:
-                return
+        # Bursty callers (partial results arriving several times per
+        # second) collapse into one scheduled drain; later calls just
+        # overwrite the pending slot
+        with self._pending_lock:
+            had_pending = self._pending_state is not None
+            self._pending_state = state
+        if not had_pending:
+            self._run_on_main_thread(self._drain_pending)
+
+    def _drain_pending(self) -> None:
+        """Apply the latest pending update() state (main thread)."""
+        with self._pending_lock:
+            state, self._pending_state = self._pending_state, None
+        if state is None:
+            return
+        self._ensure_window()
+        self._apply_state(state)
+
+    def transition(
+        self,
+        state: str,
+        auto_hide_after: Optional[float] = None,
+        text: Optional[str] = None,
+    ) -> None:
+        """Apply a state change and optional auto-hide in one hop.
+
+        Equivalent to show()/update() plus set_text() plus
+        hide(delay=...), but the config lookup, setters, fade-in and
+        hide scheduling all run inside a single callAfter closure
+        instead of one run-loop trip per call.
+
+        Args:
+            state: One of 'listening', 'processing', 'done', 'error'
+            auto_hide_after: Seconds until the indicator fades out
+            text: Optional text overriding the state's default
+        """
+        if not self.enabled or not HAS_APPKIT:
+            return
+
+        self._cancel_auto_hide()
+        generation = self._hide_generation
+
+        def _transition():
+            self._ensure_window()
 
-            config = self.STATES.get(state, self.STATES["listening"])
-            self._text_field.setStringValue_(config["text"])
+            key = state if state in self._state_table else "listening"
+            # Custom text always applies; a bare repeat of the current
+            # state only needs the hide scheduling below
+            if text is None:
+                self._apply_state(key)
+            else:
+                self._current_state = key
+                config = self._state_table[key]
+                self._set_field_text(text)
+                self._set_colors(config.bg_ns, config.text_ns, config.bg_cg)
 
-            r, g, b, a = config["bg_color"]
-            bg_color = NSColor.colorWithRed_green_blue_alpha_(r, g, b, a)
-            self._window.setBackgroundColor_(bg_color)
+            if not self._visible:
+                self._window.orderFrontRegardless()
+                self._fade(0.0, 1.0)
+                self._visible = True
 
-        self._run_on_main_thread(_update)
+            if auto_hide_after:
+                self._schedule_auto_hide(auto_hide_after, generation)
+
+        self._run_on_main_thread(_transition)
 
     def hide(self, delay: float = 0.0) -> None:
         """Hide the indicator.
@@ -200,11 +423,49 @@ class FloatingIndicator:
             return
 
         if delay > 0:
-            self._auto_hide_timer = threading.Timer(delay, self._do_hide)
-            self._auto_hide_timer.start()
+            # Run-loop timer instead of a dedicated OS thread per hide;
+            # scheduling happens on the main thread so NSTimer attaches
+            # to the AppKit run loop
+            generation = self._hide_generation
+            self._run_on_main_thread(
+                lambda: self._schedule_auto_hide(delay, generation)
+            )
         else:
             self._do_hide()
 
+    def _schedule_auto_hide(self, delay: float, generation: int) -> None:
+        """Schedule a delayed hide via NSTimer (main thread only).
+
+        One-shot NSTimer on the main run loop: no thread spawn, and the
+        callback already runs on the main thread, so a fire costs zero
+        context switches. Cancellation is a generation bump in
+        _cancel_auto_hide; a stale fire simply no-ops.
+
+        Args:
+            delay: Seconds until the hide fires
+            generation: Hide generation this schedule belongs to
+        """
+        target = _TimerTarget.alloc().init()
+        target.callback = lambda: self._do_hide_if_current(generation)
+        NSTimer.scheduledTimerWithTimeInterval_target_selector_userInfo_repeats_(
+            delay, target, "fire:", None, False
+        )
+
+    def _cancel_auto_hide(self) -> None:
+        """Void any scheduled auto-hide.
+
+        Cancellation is a bare token bump: a superseded timer fire sees
+        the newer generation in _do_hide_if_current and no-ops. No timer
+        bookkeeping or allocation, and safe from any thread (NSTimer
+        invalidation is main-thread-only, but show() is not).
+        """
+        self._hide_generation += 1
+
+    def _do_hide_if_current(self, generation: int) -> None:
+        """Hide unless a newer show() superseded this schedule."""
+        if generation == self._hide_generation:
+            self._do_hide()
+
     def _do_hide(self) -> None:
         """Actually hide the indicator."""
 
@@ -212,19 +473,15 @@ class FloatingIndicator:
             if self._window is None:
                 return
 
-            # Animate fade-out
-            NSAnimationContext.beginGrouping()
-            NSAnimationContext.currentContext().setDuration_(0.2)
-            self._window.animator().setAlphaValue_(0.0)
-            NSAnimationContext.endGrouping()
-
-            # Hide after animation
+            # The completion handler replaces the old 250ms timer
+            # thread: orderOut_ runs right when the fade finishes
             def _order_out():
                 if self._window:
                     self._window.orderOut_(None)
                 self._visible = False
+                self._current_state = None
 
-            threading.Timer(0.25, lambda: self._run_on_main_thread(_order_out)).start()
+            self._fade(1.0, 0.0, _order_out)
 
         self._run_on_main_thread(_hide)
 
@@ -235,9 +492,12 @@ class FloatingIndicator:
             func: Function to run
         """
         try:
-            from PyObjCTools import AppHelper
-
-            AppHelper.callAfter(func)
+            # Already on the main thread: run synchronously instead of
+            # parking the closure for the next run-loop tick
+            if NSThread.isMainThread():
+                func()
+            else:
+                _MAIN_QUEUE.addOperationWithBlock_(func)
         except Exception:
             # Fallback: just run directly
             func()
@@ -252,8 +512,9 @@ class FloatingIndicator:
             return
 
         def _set():
-            if self._text_field:
-                self._text_field.setStringValue_(text)
+            self._ensure_window()
+            self._current_state = None
+            self._set_field_text(text)
 
         self._run_on_main_thread(_set)
 
@@ -262,28 +523,52 @@ class FloatingIndicator:
 class PrintIndicator:
     """Simple print-based indicator when AppKit is not available."""
 
+    # Pre-formatted state lines (newline included) so the hot update()
+    # loop skips the upper()/f-string work and print()'s sep/end
+    # handling; the raw stdout write is pre-bound in __init__
+    _FORMATTED = {
+        s: f"[{s.upper()}]\n"
+        for s in ("listening", "processing", "done", "error")
+    }
+
     def __init__(self, enabled: bool = True):
         self.enabled = enabled
+        self._write = sys.stdout.write
 
     def show(self, state: str = "listening") -> None:
         if self.enabled:
-            print(f"[{state.upper()}]")
+            self._write(self._FORMATTED.get(state) or f"[{state.upper()}]\n")
 
     def update(self, state: str) -> None:
         if self.enabled:
-            print(f"[{state.upper()}]")
+            self._write(self._FORMATTED.get(state) or f"[{state.upper()}]\n")
 
     def hide(self, delay: float = 0.0) -> None:
         pass
 
+    def transition(self, state: str, auto_hide_after=None, text=None) -> None:
+        if self.enabled:
+            if text:
+                self._write(f"[{text}]\n")
+            else:
+                self._write(
+                    self._FORMATTED.get(state) or f"[{state.upper()}]\n"
+                )
+
     def set_text(self, text: str) -> None:
         if self.enabled:
-            print(f"[{text}]")
+            self._write(f"[{text}]\n")
 
 
+@functools.lru_cache(maxsize=None)
 def create_indicator(enabled: bool = True):
     """Create the appropriate indicator based on available libraries.
 
+    Cached so repeated calls share one instance (and thus one NSWindow,
+    whose allocation costs window-server round-trips) instead of
+    building a fresh window per caller, mirroring the get_history()
+    singleton.
+
     Args:
         enabled: Whether indicator should be enabled
 